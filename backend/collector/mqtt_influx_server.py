@@ -22,6 +22,14 @@ if BASE_DIR not in sys.path:
 from settings import load_settings
 
 
+# Components publish shortened wire keys to keep payloads small; rehydrate
+# them to the full field names Grafana dashboards were built against.
+SHORT_VALUE_KEYS = {
+    't': 'temperature',
+    'h': 'humidity',
+}
+
+
 def _normalize_value(value):
     if isinstance(value, bool):
         return 1.0 if value else 0.0
@@ -59,13 +67,16 @@ def main():
     def on_connect(client, userdata, flags, rc):
         if rc == 0:
             print("[SERVER] MQTT connected")
-            client.subscribe(topic)
+            # '/#' also matches the bare topic, so both the per-device
+            # subtopics and legacy flat publishes are covered
+            client.subscribe(topic + "/#")
         else:
             print(f"[SERVER] MQTT connection failed: {rc}")
 
     def on_message(client, userdata, msg):
         try:
-            data = json.loads(msg.payload.decode("utf-8"))
+            # json.loads takes bytes directly; skip the throwaway str
+            data = json.loads(msg.payload)
         except Exception:
             return
 
@@ -92,6 +103,7 @@ def main():
             raw_value = item.get("value")
             if isinstance(raw_value, dict):
                 for k, v in raw_value.items():
+                    k = SHORT_VALUE_KEYS.get(k, k)
                     norm = _normalize_value(v)
                     if norm is not None:
                         point.field(k, norm)
@@ -1,31 +1,37 @@
-from components.base import BaseComponent
-from components.door_sensor import DoorSensor
-from components.door_light import DoorLight
-from components.ultrasonic_sensor import UltrasonicSensor
-from components.buzzer import Buzzer
-from components.motion_sensor import MotionSensor
-from components.membrane_switch import MembraneSwitch
-from components.dht_sensor import DHTSensor
-from components.lcd_display import LCDDisplay
-from components.ir_receiver import IRReceiver
-from components.rgb_light import RGBLight
-from components.button import Button
-from components.four_digit_display import FourDigitDisplay
-from components.gyroscope import GyroscopeSensor
+"""Component package.
 
-__all__ = [
-    'BaseComponent',
-    'DoorSensor',
-    'DoorLight',
-    'UltrasonicSensor',
-    'Buzzer',
-    'MotionSensor',
-    'MembraneSwitch',
-    'DHTSensor',
-    'LCDDisplay',
-    'IRReceiver',
-    'RGBLight',
-    'Button',
-    'FourDigitDisplay',
-    'GyroscopeSensor',
-]
+Classes are resolved lazily on first attribute access (PEP 562 module
+__getattr__), so a controller only pays the import cost — GPIO library
+probing included — for the components it actually configures.
+"""
+
+_CLASS_MODULES = {
+    'BaseComponent':    'components.base',
+    'PinConfig':        'components.config',
+    'DoorSensor':       'components.door_sensor',
+    'DoorLight':        'components.door_light',
+    'UltrasonicSensor': 'components.ultrasonic_sensor',
+    'Buzzer':           'components.buzzer',
+    'MotionSensor':     'components.motion_sensor',
+    'MembraneSwitch':   'components.membrane_switch',
+    'DHTSensor':        'components.dht_sensor',
+    'LCDDisplay':       'components.lcd_display',
+    'IRReceiver':       'components.ir_receiver',
+    'RGBLight':         'components.rgb_light',
+    'Button':           'components.button',
+    'FourDigitDisplay': 'components.four_digit_display',
+    'GyroscopeSensor':  'components.gyroscope',
+}
+
+__all__ = list(_CLASS_MODULES)
+
+
+def __getattr__(name):
+    try:
+        module_name = _CLASS_MODULES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value   # cache: later lookups skip __getattr__
+    return value
@@ -0,0 +1,73 @@
+"""DHT22 reader backed by pigpio's DMA-timestamped edge sampling.
+
+The DHT22 1-wire protocol needs microsecond pulse-width discrimination,
+which CPython cannot do reliably (GIL + scheduler jitter lose bits and
+force Adafruit_DHT into retry loops). With pigpio, the pigpiod daemon
+samples the pin via DMA and timestamps every edge in C; Python only sees
+the finished (level, tick) list and decodes at leisure, so timing is
+deterministic regardless of interpreter load.
+"""
+
+import threading
+import time
+
+try:
+    import pigpio
+    PIGPIO_AVAILABLE = True
+except ImportError:
+    PIGPIO_AVAILABLE = False
+
+# A full frame: sensor response (2 pulses) + 40 data bits ≈ 83 edges
+_FRAME_EDGES = 83
+
+# Bit discrimination by falling-to-falling interval:
+# '0' bit ≈ 50 µs low + 27 µs high ≈ 77 µs; '1' bit ≈ 50 + 70 ≈ 120 µs
+_ONE_THRESHOLD_US = 100
+
+
+def read_dht22(pi, pin, timeout=0.2):
+    """
+    One DHT22 read via a connected pigpio.pi() handle.
+    Returns (temperature_celsius, humidity_percent), or (None, None) on a
+    short/corrupt frame. The sensor needs >= 2 s between reads.
+    """
+    edges = []
+    done = threading.Event()
+
+    def _on_edge(gpio, level, tick):
+        edges.append((level, tick))
+        if len(edges) >= _FRAME_EDGES:
+            done.set()
+
+    # Host start signal: pull low >= 1 ms, then release and listen
+    pi.set_mode(pin, pigpio.OUTPUT)
+    pi.write(pin, 0)
+    time.sleep(0.018)
+    cb = pi.callback(pin, pigpio.EITHER_EDGE, _on_edge)
+    pi.set_pull_up_down(pin, pigpio.PUD_UP)
+    pi.set_mode(pin, pigpio.INPUT)
+    done.wait(timeout)
+    cb.cancel()
+
+    # Decode: intervals between consecutive falling edges, last 40 = data
+    falling = [tick for level, tick in edges if level == 0]
+    if len(falling) < 41:
+        return (None, None)
+    falling = falling[-41:]
+    bits = [
+        1 if pigpio.tickDiff(falling[i], falling[i + 1]) > _ONE_THRESHOLD_US
+        else 0
+        for i in range(40)
+    ]
+
+    data = bytearray(5)
+    for i, bit in enumerate(bits):
+        data[i >> 3] = (data[i >> 3] << 1) | bit
+    if (data[0] + data[1] + data[2] + data[3]) & 0xFF != data[4]:
+        return (None, None)
+
+    humidity = ((data[0] << 8) | data[1]) / 10.0
+    temperature = (((data[2] & 0x7F) << 8) | data[3]) / 10.0
+    if data[2] & 0x80:
+        temperature = -temperature
+    return (temperature, humidity)
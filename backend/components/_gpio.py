@@ -0,0 +1,23 @@
+"""Shared RPi.GPIO initialization.
+
+Every GPIO-backed component used to call GPIO.setmode(GPIO.BCM) in its
+own __init__; RPi.GPIO tolerates the repetition but takes its internal
+mutex each time and can warn about the mode already being set.
+ensure_bcm() makes it a one-time, idempotent call.
+"""
+
+try:
+    import RPi.GPIO as GPIO
+    RPI_AVAILABLE = True
+except ImportError:
+    RPI_AVAILABLE = False
+
+_initialized = False
+
+
+def ensure_bcm():
+    """Set BCM pin numbering once per process (no-op off the Pi)."""
+    global _initialized
+    if not _initialized and RPI_AVAILABLE:
+        GPIO.setmode(GPIO.BCM)
+        _initialized = True
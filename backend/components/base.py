@@ -1,41 +1,142 @@
 """Base component class for all IoT components"""
 
+import threading
 import time
 
+from collections import deque
+
+from components.config import PinConfig
+
+
+# ========== PROCESS-WIDE IDLE SWEEPER ==========
+# One background timer per process (not per component) periodically flushes
+# batches that have gone idle, so slow sensors never hold readings forever.
+
+_registry      = []
+_registry_lock = threading.Lock()
+_sweeper       = None
+
+
+def _sweep():
+    """Flush idle batches on every registered component, then re-arm."""
+    global _sweeper
+    now = time.time()
+    with _registry_lock:
+        components = list(_registry)
+    for comp in components:
+        comp.flush_if_idle(now)
+    _sweeper = threading.Timer(BaseComponent.IDLE_FLUSH_SECONDS, _sweep)
+    _sweeper.daemon = True
+    _sweeper.start()
+
+
+def _register(component):
+    """Add a component to the sweep registry; start the sweeper on first use."""
+    global _sweeper
+    with _registry_lock:
+        _registry.append(component)
+        if _sweeper is None:
+            _sweeper = threading.Timer(BaseComponent.IDLE_FLUSH_SECONDS, _sweep)
+            _sweeper.daemon = True
+            _sweeper.start()
+
 
 class BaseComponent:
     """
     Base class for all IoT components.
     Handles publish logic so each component owns its own data publishing.
+
+    Publishes are buffered in a small per-component ring buffer and flushed
+    to the publisher in one enqueue_batch() call, either when the buffer
+    reaches BUFFERED_MSG_COUNT payloads or when it has sat idle for
+    IDLE_FLUSH_SECONDS. This amortizes queue/serialize overhead across many
+    small sensor events instead of paying it once per reading.
     """
 
+    BUFFERED_MSG_COUNT = 8     # flush once this many payloads are buffered
+    IDLE_FLUSH_SECONDS = 1.0   # flush a non-empty buffer after this much idle time
+    BATCH_MAXLEN       = 64    # hard cap so a dead publisher can't grow memory
+
     def __init__(self, code, settings, publisher=None):
         self.code = code
+        # Accept either a raw settings dict (historic call sites) or an
+        # already-built PinConfig; normalize once so the flags below are
+        # plain attribute reads everywhere else.
+        if not isinstance(settings, PinConfig):
+            settings = PinConfig.from_settings(settings)
         self.settings = settings
-        self.simulate = settings.get('simulate', True)
-        self.publish_enabled = settings.get('publish', True)
-        self._publisher = publisher
+        self.simulate = settings.simulate
+        self.publish_enabled = settings.publish
+        self._publisher = None
+        self._payload_template = None
+        self.set_publisher(publisher)
+
+        self._batch      = deque(maxlen=self.BATCH_MAXLEN)
+        self._batch_lock = threading.Lock()
+        self._last_flush = time.time()
+        _register(self)
 
     def set_publisher(self, publisher):
         """Set or replace the MQTT publisher"""
         self._publisher = publisher
+        if publisher is not None:
+            # Constant payload fields, precomputed once so _publish only has
+            # to copy and fill in the per-event fields.
+            self._payload_template = {
+                'device': publisher.device_info.get('id', 'UNKNOWN'),
+                'sensor': self.code,
+            }
+            # Default-omit: consumers treat a missing flag as not simulated
+            if self.simulate:
+                self._payload_template['simulated'] = True
 
     def _publish(self, value, source='sensor', extra=None):
-        """Internal publish — builds payload and enqueues it"""
+        """Internal publish — builds payload and buffers it for batched delivery"""
         if not self.publish_enabled or self._publisher is None:
             return
-        device_id = self._publisher.device_info.get('id', 'UNKNOWN')
-        payload = {
-            'device': device_id,
-            'source': source,
-            'sensor': self.code,
-            'value': value,
-            'simulated': self.simulate,
-            'ts': time.time()
-        }
+        payload = self._payload_template.copy()
+        payload['source'] = source
+        payload['value'] = value
+        payload['ts'] = time.time()
         if extra:
             payload.update(extra)
-        self._publisher.enqueue(payload)
+
+        # The lock only covers the buffer swap; the publisher handoff
+        # (which pickles the batch into the queue) runs outside it, so a
+        # slow handoff never stalls another sensor thread mid-publish.
+        items = None
+        with self._batch_lock:
+            self._batch.append(payload)
+            if (len(self._batch) >= self.BUFFERED_MSG_COUNT
+                    or time.time() - self._last_flush > self.IDLE_FLUSH_SECONDS):
+                items = self._drain_locked()
+        if items:
+            self._publisher.enqueue_batch(items)
+
+    def flush(self):
+        """Hand any buffered payloads to the publisher in a single batch."""
+        with self._batch_lock:
+            items = self._drain_locked()
+        if items and self._publisher is not None:
+            self._publisher.enqueue_batch(items)
+
+    def flush_if_idle(self, now):
+        """Called by the process-wide sweeper: flush if the buffer has gone idle."""
+        items = None
+        with self._batch_lock:
+            if self._batch and now - self._last_flush > self.IDLE_FLUSH_SECONDS:
+                items = self._drain_locked()
+        if items and self._publisher is not None:
+            self._publisher.enqueue_batch(items)
+
+    def _drain_locked(self):
+        """Swap out the buffered payloads; caller must hold _batch_lock."""
+        self._last_flush = time.time()
+        if not self._batch:
+            return None
+        items = list(self._batch)
+        self._batch.clear()
+        return items
 
     def _publish_sensor(self, value, extra=None):
         """Publish a sensor reading"""
@@ -46,5 +147,6 @@ class BaseComponent:
         self._publish(value, 'actuator', extra)
 
     def cleanup(self):
-        """Override in subclasses to release GPIO resources"""
-        pass
+        """Flush buffered payloads; overrides must chain super().cleanup()
+        after releasing their GPIO resources."""
+        self.flush()
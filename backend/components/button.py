@@ -1,5 +1,7 @@
 """Button (BTN) component - momentary press button"""
 
+import logging
+
 try:
     import RPi.GPIO as GPIO
     GPIO_AVAILABLE = True
@@ -7,6 +9,9 @@ except ImportError:
     GPIO_AVAILABLE = False
 
 from components.base import BaseComponent
+from components._gpio import ensure_bcm
+
+log = logging.getLogger(__name__)
 
 
 class Button(BaseComponent):
@@ -28,7 +33,7 @@ class Button(BaseComponent):
         self._monitoring = False
 
         if not self.simulate and GPIO_AVAILABLE:
-            GPIO.setmode(GPIO.BCM)
+            ensure_bcm()
             GPIO.setup(self.pin, GPIO.IN, pull_up_down=GPIO.PUD_UP)
 
     # ========== SIMULATION ==========
@@ -59,7 +64,7 @@ class Button(BaseComponent):
 
     def _gpio_callback(self, channel):
         self._publish_sensor(True, extra={'action': 'press'})
-        print(f"[{self.code}] Button pressed")
+        log.debug("[%s] Button pressed", self.code)
         if self.on_press:
             self.on_press()
 
@@ -76,3 +81,4 @@ class Button(BaseComponent):
                 GPIO.cleanup(self.pin)
             except Exception:
                 pass
+        super().cleanup()   # flush buffered payloads
@@ -4,6 +4,7 @@ import time
 import threading
 
 from components.base import BaseComponent
+from components._gpio import ensure_bcm
 
 try:
     import RPi.GPIO as GPIO
@@ -28,7 +29,7 @@ class Buzzer(BaseComponent):
         self._alarm_thread = None
 
         if not self.simulate and RPI_AVAILABLE:
-            GPIO.setmode(GPIO.BCM)
+            ensure_bcm()
             GPIO.setup(self.pin, GPIO.OUT)
             GPIO.output(self.pin, GPIO.LOW)
 
@@ -93,3 +94,4 @@ class Buzzer(BaseComponent):
         self.stop_alarm()
         if not self.simulate and RPI_AVAILABLE:
             GPIO.cleanup(self.pin)
+        super().cleanup()   # flush buffered payloads
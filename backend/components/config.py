@@ -0,0 +1,33 @@
+"""Per-component configuration struct.
+
+Component settings arrive as plain dicts sliced out of the YAML-style
+settings tree. PinConfig normalizes one slice into a frozen, slotted
+struct at construction time: the flags every component consults
+(simulate / publish) become real attributes read once in
+BaseComponent.__init__ instead of repeated dict lookups, and bad values
+fail at load time rather than at first use. Component-specific keys
+(pins, addresses, row/col lists) stay reachable through get(), so
+subclass __init__ code is unchanged.
+"""
+
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True, slots=True)
+class PinConfig:
+    simulate: bool = True
+    publish: bool = True
+    extra: dict = field(default_factory=dict)
+
+    @classmethod
+    def from_settings(cls, settings):
+        """Build from a raw settings dict (validates the common flags)."""
+        return cls(
+            simulate=bool(settings.get('simulate', True)),
+            publish=bool(settings.get('publish', True)),
+            extra=dict(settings),
+        )
+
+    def get(self, key, default=None):
+        """Dict-style access for component-specific keys."""
+        return self.extra.get(key, default)
@@ -3,6 +3,8 @@
 import random
 
 from components.base import BaseComponent
+from components.scheduler import get_scheduler
+from components._dht22 import read_dht22, PIGPIO_AVAILABLE
 
 try:
     import Adafruit_DHT
@@ -10,6 +12,9 @@ try:
 except ImportError:
     DHT_AVAILABLE = False
 
+if PIGPIO_AVAILABLE:
+    import pigpio
+
 
 class DHTSensor(BaseComponent):
     """
@@ -22,43 +27,116 @@ class DHTSensor(BaseComponent):
     """
 
     DHT_SENSOR_TYPE = 22  # DHT22
+    RETRY_INTERVAL  = 0.5  # seconds between background retries
+    MAX_RETRIES     = 3
 
     def __init__(self, code, settings, publisher=None):
         super().__init__(code, settings, publisher)
         self.pin = settings.get('pin', 4)
-        self._temp = round(random.uniform(18.0, 28.0), 1)
-        self._humidity = round(random.uniform(40.0, 70.0), 1)
+        # Until the first successful HW read, callers see these defaults
+        self._temp = random.uniform(18.0, 28.0)
+        self._humidity = random.uniform(40.0, 70.0)
+        self._retry_handle = None
+        self._retries_left = 0
+
+        # Prefer pigpio's DMA-timestamped sampling over Adafruit_DHT's
+        # Python-side bit timing (see components/_dht22.py)
+        self._pi = None
+        if not self.simulate and PIGPIO_AVAILABLE:
+            try:
+                pi = pigpio.pi()
+                if pi.connected:
+                    self._pi = pi
+            except Exception:
+                self._pi = None
 
     def read(self):
         """
         Read temperature and humidity.
         Returns (temperature_celsius, humidity_percent) tuple.
         In simulation, returns the last simulated values.
-        On real HW, calls Adafruit_DHT.read_retry().
+        On real HW, does a single Adafruit_DHT.read() attempt; a failed
+        attempt queues background retries on the shared scheduler and the
+        last good (cached) values are returned immediately, so the caller
+        never blocks on the sensor's ~2 s internal retry loop.
         """
         if self.simulate:
             return (self._temp, self._humidity)
-        elif DHT_AVAILABLE:
-            humidity, temperature = Adafruit_DHT.read_retry(
-                self.DHT_SENSOR_TYPE, self.pin
-            )
-            if humidity is not None and temperature is not None:
-                self._temp = round(temperature, 1)
-                self._humidity = round(humidity, 1)
+        if self._pi is not None or DHT_AVAILABLE:
+            temperature, humidity = self._hw_read_once()
+            if temperature is not None:
+                self._temp = temperature
+                self._humidity = humidity
+            else:
+                self._schedule_retry()
         return (self._temp, self._humidity)
 
+    def _hw_read_once(self):
+        """
+        Single HW read attempt; returns (temp, humidity) or (None, None).
+        Uses the pigpio DMA-backed reader when pigpiod is running, falling
+        back to one Adafruit_DHT.read() otherwise.
+        """
+        if self._pi is not None:
+            return read_dht22(self._pi, self.pin)
+        humidity, temperature = Adafruit_DHT.read(
+            self.DHT_SENSOR_TYPE, self.pin
+        )
+        if humidity is None or temperature is None:
+            return (None, None)
+        return (temperature, humidity)
+
+    def _schedule_retry(self):
+        """Queue up to MAX_RETRIES background read attempts."""
+        self._retries_left = self.MAX_RETRIES
+        if self._retry_handle is None:
+            self._retry_handle = get_scheduler().add(
+                self.RETRY_INTERVAL, self._retry)
+
+    def _retry(self):
+        """One background read attempt, run on the shared scheduler thread."""
+        temperature, humidity = self._hw_read_once()
+        if temperature is not None:
+            self._temp = temperature
+            self._humidity = humidity
+            self._retries_left = 0
+        else:
+            self._retries_left -= 1
+        if self._retries_left <= 0 and self._retry_handle is not None:
+            get_scheduler().cancel(self._retry_handle)
+            self._retry_handle = None
+
     def set_values(self, temp, humidity):
-        """Inject simulated values (used by SensorSimulator)"""
-        self._temp = round(temp, 1)
-        self._humidity = round(humidity, 1)
+        """
+        Inject simulated values (used by SensorSimulator).
+        Stored unrounded; consumers format for display themselves.
+        """
+        self._temp = temp
+        self._humidity = humidity
 
     def read_and_publish(self, silent=False):
         """Read current values, publish them, optionally print, and return them."""
-        temp, humidity = self.read()
-        self._publish_sensor({'temperature': temp, 'humidity': humidity})
+        if self.simulate:
+            # Fused sim fast-path: the cached values are the reading, so skip
+            # the read() call layering entirely
+            temp, humidity = self._temp, self._humidity
+        else:
+            temp, humidity = self.read()
+        # Short wire keys ('t'/'h') keep the payload small; the collector
+        # rehydrates them to 'temperature'/'humidity' for Influx/Grafana.
+        self._publish_sensor({'t': temp, 'h': humidity})
         if not silent:
-            print(f"[{self.code}] Temp={temp}C  Humidity={humidity}%")
+            print(f"[{self.code}] Temp={temp:.1f}C  Humidity={humidity:.1f}%")
         return (temp, humidity)
 
     def cleanup(self):
-        pass
+        if self._retry_handle is not None:
+            get_scheduler().cancel(self._retry_handle)
+            self._retry_handle = None
+        if self._pi is not None:
+            try:
+                self._pi.stop()
+            except Exception:
+                pass
+            self._pi = None
+        super().cleanup()   # flush buffered payloads
@@ -1,6 +1,10 @@
 """Door Light component (LED diode) - DL"""
 
+import threading
+import time
+
 from components.base import BaseComponent
+from components._gpio import ensure_bcm
 
 try:
     import RPi.GPIO as GPIO
@@ -12,38 +16,77 @@ except ImportError:
 class DoorLight(BaseComponent):
     """
     Door Light (LED diode) - DL
-    Controls an LED. Publishes its own state changes on every turn_on / turn_off.
+    Controls an LED. State changes are committed (GPIO write + publish)
+    through a short debounce window, so rapid back-to-back toggles collapse
+    into a single write of the final state.
     """
 
+    DEBOUNCE_SECONDS  = 0.02   # window for coalescing rapid toggles
+    REPUBLISH_SECONDS = 1.0    # min gap between identical-state re-commits
+
     def __init__(self, code, settings, publisher=None):
         super().__init__(code, settings, publisher)
         self.pin = settings.get('pin', 27)
         self.state = False
 
+        self._debounce_timer = None
+        self._debounce_lock  = threading.Lock()
+        self._last_commit_state = None
+        self._last_commit_ts    = 0.0
+
         if not self.simulate and RPI_AVAILABLE:
-            GPIO.setmode(GPIO.BCM)
+            ensure_bcm()
             GPIO.setup(self.pin, GPIO.OUT)
             GPIO.output(self.pin, GPIO.LOW)
 
     def turn_on(self, reason=None):
+        if self._already_committed(True):
+            return
         self.state = True
-        if not self.simulate and RPI_AVAILABLE:
-            GPIO.output(self.pin, GPIO.HIGH)
         msg = f"[{self.code}] Light ON"
         if reason:
             msg += f" ({reason})"
         print(msg)
-        self._publish_actuator(True)
+        self._schedule_commit()
 
     def turn_off(self, reason=None):
+        if self._already_committed(False):
+            return
         self.state = False
-        if not self.simulate and RPI_AVAILABLE:
-            GPIO.output(self.pin, GPIO.LOW)
         msg = f"[{self.code}] Light OFF"
         if reason:
             msg += f" ({reason})"
         print(msg)
-        self._publish_actuator(False)
+        self._schedule_commit()
+
+    def _already_committed(self, state):
+        """Idempotent fast path: repeated motion events keep re-requesting
+        the state the light is already in; skip the print and re-publish
+        unless the last commit has gone stale."""
+        return (self.state is state
+                and self._last_commit_state is state
+                and time.monotonic() - self._last_commit_ts < self.REPUBLISH_SECONDS)
+
+    def _schedule_commit(self):
+        """(Re)arm the debounce timer; only the settled state is committed."""
+        with self._debounce_lock:
+            if self._debounce_timer is not None:
+                self._debounce_timer.cancel()
+            self._debounce_timer = threading.Timer(
+                self.DEBOUNCE_SECONDS, self._commit)
+            self._debounce_timer.daemon = True
+            self._debounce_timer.start()
+
+    def _commit(self):
+        """Write the settled state to GPIO and publish it once."""
+        with self._debounce_lock:
+            self._debounce_timer = None
+            state = self.state
+        if not self.simulate and RPI_AVAILABLE:
+            GPIO.output(self.pin, GPIO.HIGH if state else GPIO.LOW)
+        self._last_commit_state = state
+        self._last_commit_ts    = time.monotonic()
+        self._publish_actuator(state)
 
     def toggle(self):
         if self.state:
@@ -55,5 +98,10 @@ class DoorLight(BaseComponent):
         return self.state
 
     def cleanup(self):
+        with self._debounce_lock:
+            if self._debounce_timer is not None:
+                self._debounce_timer.cancel()
+                self._debounce_timer = None
         if not self.simulate and RPI_AVAILABLE:
             GPIO.cleanup(self.pin)
+        super().cleanup()   # flush buffered payloads
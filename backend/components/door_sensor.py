@@ -4,6 +4,7 @@ import time
 import threading
 
 from components.base import BaseComponent
+from components._gpio import ensure_bcm
 
 try:
     import RPi.GPIO as GPIO
@@ -31,7 +32,7 @@ class DoorSensor(BaseComponent):
         self._last_state = False
 
         if not self.simulate and RPI_AVAILABLE:
-            GPIO.setmode(GPIO.BCM)
+            ensure_bcm()
             GPIO.setup(self.pin, GPIO.IN, pull_up_down=GPIO.PUD_UP)
 
     def read(self):
@@ -82,3 +83,4 @@ class DoorSensor(BaseComponent):
         self.stop()
         if not self.simulate and RPI_AVAILABLE:
             GPIO.cleanup(self.pin)
+        super().cleanup()   # flush buffered payloads
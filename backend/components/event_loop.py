@@ -0,0 +1,23 @@
+"""Shared asyncio event loop for component background tasks.
+
+Components that need periodic work (e.g. display blinking) schedule
+coroutines on this single loop instead of each spawning a dedicated
+OS thread. One helper thread serves every component in the process.
+"""
+
+import asyncio
+import threading
+
+_loop = None
+_lock = threading.Lock()
+
+
+def get_loop():
+    """Return the shared event loop, starting its helper thread on first use."""
+    global _loop
+    with _lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=_loop.run_forever, daemon=True)
+            thread.start()
+    return _loop
@@ -1,7 +1,7 @@
 """4-Digit 7-Segment Display (4SD) component - TM1637 based"""
 
-import threading
-import time
+import asyncio
+import logging
 
 try:
     import tm1637
@@ -10,6 +10,17 @@ except ImportError:
     TM1637_AVAILABLE = False
 
 from components.base import BaseComponent
+from components.event_loop import get_loop
+
+log = logging.getLogger(__name__)
+
+# The kitchen timer redraws one of the same ~3600 values every tick, so the
+# ("MMSS", "MM:SS") pair for each second under an hour is built once here
+# instead of two f-strings per tick (index == total seconds)
+_TIME_STRINGS = [
+    (f"{m:02d}{s:02d}", f"{m:02d}:{s:02d}")
+    for m in range(60) for s in range(60)
+]
 
 
 class FourDigitDisplay(BaseComponent):
@@ -29,9 +40,10 @@ class FourDigitDisplay(BaseComponent):
         self.pin_dio = settings.get('pin_dio', 23)
 
         self._display       = None
-        self._blink_thread  = None
+        self._blink_task    = None
         self._blink_active  = False
         self._current_text  = "    "
+        self._last_seconds  = -1   # dedupe repeated show_time() ticks
 
         if not self.simulate and TM1637_AVAILABLE:
             try:
@@ -45,30 +57,45 @@ class FourDigitDisplay(BaseComponent):
     def show_time(self, total_seconds):
         """Display time as MM:SS.  Used by kitchen timer (Rule 8)."""
         total_seconds = max(0, int(total_seconds))
-        minutes = total_seconds // 60
-        seconds = total_seconds % 60
-        text    = f"{minutes:02d}{seconds:02d}"
+        # Idempotency: sub-second re-ticks of the same value are no-ops
+        if total_seconds == self._last_seconds:
+            return
+        self._last_seconds = total_seconds
+        try:
+            text, pretty = _TIME_STRINGS[total_seconds]
+        except IndexError:   # >= 1 h: format the odd value out
+            minutes, seconds = divmod(total_seconds, 60)
+            text   = f"{minutes:02d}{seconds:02d}"
+            pretty = f"{minutes:02d}:{seconds:02d}"
         self._current_text = text
 
         self._publish_sensor(
             total_seconds,
-            extra={'display': f"{minutes:02d}:{seconds:02d}", 'action': 'show_time'},
+            extra={'d': pretty, 'a': 'show_time'},
         )
-        print(f"[{self.code}] Timer: {minutes:02d}:{seconds:02d}")
+        log.debug("[%s] Timer: %s", self.code, pretty)
 
         if self._display:
             try:
-                self._display.numbers(minutes, seconds)
+                self._display.numbers(*divmod(total_seconds, 60))
             except Exception:
                 pass
 
     def show_text(self, text):
         """Display up to 4 characters of arbitrary text."""
-        text = str(text)[:4].ljust(4)
+        # Fast path: callers (timer strings, blink, clear) almost always
+        # pass an exact 4-char string, so skip the str/slice/ljust churn
+        if not (isinstance(text, str) and len(text) == 4):
+            text = str(text)[:4].ljust(4)
+        # Idempotency: re-writing the text already shown would only drive
+        # the TM1637 bus for nothing (common during blink toggling)
+        if text == self._current_text and self._last_seconds == -1:
+            return
         self._current_text = text
+        self._last_seconds = -1   # display no longer shows a timer value
 
-        self._publish_sensor(text, extra={'action': 'show_text'})
-        print(f"[{self.code}] Display: {text!r}")
+        self._publish_sensor(text, extra={'a': 'show_text'})
+        log.debug("[%s] Display: %r", self.code, text)
 
         if self._display:
             try:
@@ -79,6 +106,7 @@ class FourDigitDisplay(BaseComponent):
     def clear(self):
         """Turn off all segments."""
         self._current_text = "    "
+        self._last_seconds = -1
         if self._display:
             try:
                 self._display.show("    ")
@@ -91,30 +119,28 @@ class FourDigitDisplay(BaseComponent):
         """
         Blink the display repeatedly.
         Called when the kitchen timer reaches zero (Rule 8c).
+        Runs as a coroutine on the shared component event loop, so any
+        number of blinking displays cost one helper thread total.
         """
         self.stop_blink()
         self._blink_active = True
-        self._blink_thread = threading.Thread(
-            target=self._blink_loop,
-            args=(text, interval),
-            daemon=True,
-        )
-        self._blink_thread.start()
-        self._publish_sensor(text, extra={'action': 'blink_start'})
+        self._blink_task = asyncio.run_coroutine_threadsafe(
+            self._blink_coro(text, interval), get_loop())
+        self._publish_sensor(text, extra={'a': 'blink_start'})
         print(f"[{self.code}] Blinking {text!r}")
 
     def stop_blink(self):
         """Stop blinking and clear the display."""
         if self._blink_active:
             self._blink_active = False
-            self._publish_sensor(self._current_text, extra={'action': 'blink_stop'})
+            self._publish_sensor(self._current_text, extra={'a': 'blink_stop'})
             print(f"[{self.code}] Blink stopped")
-            if self._blink_thread:
-                self._blink_thread.join(timeout=1)
-                self._blink_thread = None
+            if self._blink_task:
+                self._blink_task.cancel()
+                self._blink_task = None
             self.clear()
 
-    def _blink_loop(self, text, interval):
+    async def _blink_coro(self, text, interval):
         visible = True
         while self._blink_active:
             if visible:
@@ -122,7 +148,7 @@ class FourDigitDisplay(BaseComponent):
             else:
                 self.clear()
             visible = not visible
-            time.sleep(interval)
+            await asyncio.sleep(interval)
 
     # ========== QUERY ==========
 
@@ -140,3 +166,4 @@ class FourDigitDisplay(BaseComponent):
     def cleanup(self):
         self.stop()
         self.clear()
+        super().cleanup()   # flush buffered payloads
@@ -1,9 +1,8 @@
 """Gyroscope / Accelerometer sensor (GSG) - MPU-6050 via I2C"""
 
+import logging
 import math
 import random
-import threading
-import time
 
 try:
     from mpu6050 import mpu6050
@@ -12,6 +11,9 @@ except ImportError:
     MPU6050_AVAILABLE = False
 
 from components.base import BaseComponent
+from components.scheduler import get_scheduler
+
+log = logging.getLogger(__name__)
 
 
 class GyroscopeSensor(BaseComponent):
@@ -37,11 +39,15 @@ class GyroscopeSensor(BaseComponent):
         self.on_displacement = on_displacement
 
         self._monitoring  = False
-        self._thread      = None
+        self._poll_handle = None
         self._sensor      = None
 
         # Last known accelerometer reading (used to compute delta)
-        self._last_accel = {'x': 0.0, 'y': 0.0, 'z': 1.0}  # resting: 1 g on z-axis
+        # Kept as three floats (not a dict) so the hot path avoids dict churn
+        self._lx, self._ly, self._lz = 0.0, 0.0, 1.0  # resting: 1 g on z-axis
+
+        # Compare squared distances; sqrt only runs on the rare publish branch
+        self._threshold_sq = self.DISPLACEMENT_THRESHOLD ** 2
 
         # Simulated state
         self._sim_accel = {'x': 0.0, 'y': 0.0, 'z': 1.0}
@@ -57,11 +63,16 @@ class GyroscopeSensor(BaseComponent):
     # ========== READ ==========
 
     def read(self):
-        """Return current accelerometer + gyroscope data as a dict."""
+        """
+        Return current accelerometer + gyroscope data as a dict.
+        The returned dicts are shared, read-only views: injection replaces
+        them wholesale (never mutates in place), so no defensive copy is
+        needed per read.
+        """
         if self.simulate:
             return {
-                'accel': self._sim_accel.copy(),
-                'gyro':  self._sim_gyro.copy(),
+                'accel': self._sim_accel,
+                'gyro':  self._sim_gyro,
             }
         if self._sensor:
             try:
@@ -88,8 +99,8 @@ class GyroscopeSensor(BaseComponent):
     def inject_significant_move(self):
         """Simulation: inject a clearly significant movement (guaranteed to exceed threshold)."""
         # Reset to resting state so delta is always computed from baseline
-        # (on real HW the monitoring loop would update _last_accel between events)
-        self._last_accel = {'x': 0.0, 'y': 0.0, 'z': 1.0}
+        # (on real HW the monitoring loop would update the baseline between events)
+        self._lx, self._ly, self._lz = 0.0, 0.0, 1.0
         ax = random.uniform(0.9, 1.5)
         ay = random.uniform(0.9, 1.5)
         az = random.uniform(0.0, 0.3)
@@ -105,47 +116,49 @@ class GyroscopeSensor(BaseComponent):
             print(f"[{self.code}] No HW sensor – skipping monitoring")
             return
         self._monitoring = True
-        self._thread = threading.Thread(target=self._monitor_loop, daemon=True)
-        self._thread.start()
+        # One shared scheduler thread serves every polled component
+        self._poll_handle = get_scheduler().add(self.POLL_INTERVAL, self._poll_once)
         print(f"[{self.code}] Monitoring started (threshold={self.DISPLACEMENT_THRESHOLD} g)")
 
-    def _monitor_loop(self):
-        while self._monitoring:
-            try:
-                accel = self._sensor.get_accel_data()
-                self._evaluate_accel(accel)
-            except Exception:
-                pass
-            time.sleep(self.POLL_INTERVAL)
+    def _poll_once(self):
+        """Single poll tick, run on the shared scheduler thread."""
+        if not self._monitoring:
+            return
+        try:
+            self._evaluate_accel(self._sensor.get_accel_data())
+        except Exception:
+            pass
 
     # ========== INTERNAL ==========
 
     def _evaluate_accel(self, accel):
         """Compute acceleration delta vs last reading; fire callback if threshold exceeded."""
-        dx = accel.get('x', 0.0) - self._last_accel['x']
-        dy = accel.get('y', 0.0) - self._last_accel['y']
-        dz = accel.get('z', 1.0) - self._last_accel['z']
-        delta = math.sqrt(dx*dx + dy*dy + dz*dz)
+        ax = accel.get('x', 0.0)
+        ay = accel.get('y', 0.0)
+        az = accel.get('z', 1.0)
+        dx = ax - self._lx
+        dy = ay - self._ly
+        dz = az - self._lz
+        delta_sq = dx*dx + dy*dy + dz*dz
 
         # Always update last reading
-        self._last_accel = {
-            'x': accel.get('x', 0.0),
-            'y': accel.get('y', 0.0),
-            'z': accel.get('z', 1.0),
-        }
+        self._lx, self._ly, self._lz = ax, ay, az
 
-        if delta >= self.DISPLACEMENT_THRESHOLD:
+        if delta_sq >= self._threshold_sq:
+            delta = math.sqrt(delta_sq)
+            # Short wire keys; 'delta' is already carried as the value itself.
+            # One round() on the reported value only — the per-axis rounds
+            # were pure publish-time overhead.
             self._publish_sensor(
                 round(delta, 4),
                 extra={
-                    'ax':          round(accel.get('x', 0.0), 4),
-                    'ay':          round(accel.get('y', 0.0), 4),
-                    'az':          round(accel.get('z', 1.0), 4),
-                    'delta':       round(delta, 4),
-                    'significant': True,
+                    'x':   ax,
+                    'y':   ay,
+                    'z':   az,
+                    'sig': True,
                 },
             )
-            print(f"[{self.code}] Significant displacement! delta={delta:.3f} g")
+            log.debug("[%s] Significant displacement! delta=%.3f g", self.code, delta)
             if self.on_displacement:
                 self.on_displacement(delta, accel)
 
@@ -153,9 +166,10 @@ class GyroscopeSensor(BaseComponent):
 
     def stop(self):
         self._monitoring = False
-        if self._thread:
-            self._thread.join(timeout=1)
-            self._thread = None
+        if self._poll_handle is not None:
+            get_scheduler().cancel(self._poll_handle)
+            self._poll_handle = None
 
     def cleanup(self):
         self.stop()
+        super().cleanup()   # flush buffered payloads
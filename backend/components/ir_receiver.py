@@ -1,10 +1,48 @@
 """IR Receiver component"""
 
+import logging
+import selectors
 import threading
-import time
+
+from collections import deque
 
 from components.base import BaseComponent
 
+log = logging.getLogger(__name__)
+
+# ========== SHARED HW DISPATCH ==========
+# All IR input devices register with one selector (epoll on Linux) served by
+# a single dispatch thread, instead of one blocking read_loop() thread each.
+
+_hw_selector = selectors.DefaultSelector()
+_hw_thread = None
+_hw_lock = threading.Lock()
+
+
+def _hw_dispatch_loop():
+    while True:
+        for key, _ in _hw_selector.select(timeout=1):
+            key.data._drain_device()
+
+
+def _hw_register(receiver):
+    """Register a receiver's device; start the dispatch thread on first use."""
+    global _hw_thread
+    with _hw_lock:
+        _hw_selector.register(receiver._device.fileno(),
+                              selectors.EVENT_READ, receiver)
+        if _hw_thread is None:
+            _hw_thread = threading.Thread(target=_hw_dispatch_loop, daemon=True)
+            _hw_thread.start()
+
+
+def _hw_unregister(receiver):
+    with _hw_lock:
+        try:
+            _hw_selector.unregister(receiver._device.fileno())
+        except (KeyError, ValueError):
+            pass
+
 try:
     import evdev
     EVDEV_AVAILABLE = True
@@ -30,7 +68,8 @@ class IRReceiver(BaseComponent):
 
         self.running = False
         self._thread = None
-        self._injected_code = None
+        self._injected = deque()
+        self._inject_event = threading.Event()
         self._device = None
 
         if not self.simulate and EVDEV_AVAILABLE:
@@ -50,52 +89,56 @@ class IRReceiver(BaseComponent):
     def inject_code(self, code):
         """
         Inject a simulated IR code (simulation mode).
-        The monitoring thread picks this up on the next poll cycle.
+        Wakes the monitoring thread immediately via an Event, so the sim loop
+        sleeps with zero CPU while idle instead of polling.
         Mirrors set_motion() and set_key() on other components.
         """
-        self._injected_code = code
+        self._injected.append(code)
+        self._inject_event.set()
 
     def start_monitoring(self):
-        """Start background thread to listen for IR codes"""
+        """Start listening for IR codes"""
         self.running = True
-        self._thread = threading.Thread(target=self._monitor_loop, daemon=True)
-        self._thread.start()
-
-    def _monitor_loop(self):
         if self.simulate:
-            self._sim_loop()
+            self._thread = threading.Thread(target=self._sim_loop, daemon=True)
+            self._thread.start()
         elif self._device is not None:
-            self._hw_loop()
+            # Shared epoll dispatch: no per-receiver thread on real HW
+            _hw_register(self)
 
     def _sim_loop(self):
-        """Poll for injected codes in simulation mode"""
+        """Block until a code is injected (simulation mode); no busy polling"""
         while self.running:
-            code = self._injected_code
-            if code is not None:
-                self._injected_code = None
-                self._on_code_received(code)
-            time.sleep(0.05)
-
-    def _hw_loop(self):
-        """Read evdev events from the IR receiver device"""
-        for event in self._device.read_loop():
-            if not self.running:
-                break
-            if event.type == evdev.ecodes.EV_KEY and event.value == 1:
-                code = str(event.code)
-                self._on_code_received(code)
+            self._inject_event.wait()
+            self._inject_event.clear()
+            while self._injected:
+                self._on_code_received(self._injected.popleft())
+
+    def _drain_device(self):
+        """Read all pending evdev events (called from the shared dispatcher)"""
+        if not self.running or self._device is None:
+            return
+        try:
+            for event in self._device.read():
+                if event.type == evdev.ecodes.EV_KEY and event.value == 1:
+                    self._on_code_received(str(event.code))
+        except (BlockingIOError, OSError):
+            pass
 
     def _on_code_received(self, code):
         """Internal handler: print, publish, then call the controller hook."""
-        print(f"\n[{self.code}] IR code received: '{code}'")
+        log.debug("[%s] IR code received: %r", self.code, code)
         self._publish_sensor(code)
         if self.on_code:
             self.on_code(code)
 
     def stop(self):
         self.running = False
+        self._inject_event.set()   # wake the sim loop so it can exit
         if self._thread:
             self._thread.join(timeout=1)
+        if self._device is not None:
+            _hw_unregister(self)
 
     def cleanup(self):
         self.stop()
@@ -104,3 +147,4 @@ class IRReceiver(BaseComponent):
                 self._device.close()
             except Exception:
                 pass
+        super().cleanup()   # flush buffered payloads
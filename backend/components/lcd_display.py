@@ -42,6 +42,9 @@ class LCDDisplay(BaseComponent):
         """
         Display two lines of text on the LCD.
         Truncates each line to 16 characters.
+
+        Display-only: nothing is published per redraw, so cycling the
+        LCD costs no MQTT traffic.
         """
         self._line1 = str(line1)[:16]
         self._line2 = str(line2)[:16]
@@ -70,3 +73,4 @@ class LCDDisplay(BaseComponent):
                 self._lcd.close(clear=True)
             except Exception:
                 pass
+        super().cleanup()   # flush buffered payloads
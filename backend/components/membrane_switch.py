@@ -1,9 +1,13 @@
 """Membrane Switch component (4x4 Keypad) - DMS"""
 
+import logging
 import time
 import threading
 
 from components.base import BaseComponent
+from components._gpio import ensure_bcm
+
+log = logging.getLogger(__name__)
 
 try:
     import RPi.GPIO as GPIO
@@ -11,6 +15,12 @@ try:
 except ImportError:
     RPI_AVAILABLE = False
 
+try:
+    import pigpio
+    PIGPIO_AVAILABLE = True
+except ImportError:
+    PIGPIO_AVAILABLE = False
+
 
 class MembraneSwitch(BaseComponent):
     """
@@ -37,8 +47,29 @@ class MembraneSwitch(BaseComponent):
         self.last_key = None
         self._simulated_key = None
 
-        if not self.simulate and RPI_AVAILABLE:
-            GPIO.setmode(GPIO.BCM)
+        # pigpio fast path: read all four column bits in one banked read
+        # instead of four GPIO.input() roundtrips per strobed row.
+        self._pi = None
+        self._col_mask = 0
+        self._bit_to_col = {}
+        if not self.simulate and PIGPIO_AVAILABLE:
+            try:
+                pi = pigpio.pi()
+                if pi.connected:
+                    self._pi = pi
+                    self._col_mask = sum(1 << p for p in self.col_pins)
+                    self._bit_to_col = {1 << p: j for j, p in enumerate(self.col_pins)}
+                    for pin in self.row_pins:
+                        pi.set_mode(pin, pigpio.OUTPUT)
+                        pi.write(pin, 0)
+                    for pin in self.col_pins:
+                        pi.set_mode(pin, pigpio.INPUT)
+                        pi.set_pull_up_down(pin, pigpio.PUD_DOWN)
+            except Exception:
+                self._pi = None
+
+        if not self.simulate and self._pi is None and RPI_AVAILABLE:
+            ensure_bcm()
             for pin in self.row_pins:
                 GPIO.setup(pin, GPIO.OUT)
                 GPIO.output(pin, GPIO.LOW)
@@ -51,6 +82,15 @@ class MembraneSwitch(BaseComponent):
             key = self._simulated_key
             self._simulated_key = None
             return key
+        elif self._pi is not None:
+            for i, row_pin in enumerate(self.row_pins):
+                self._pi.write(row_pin, 1)
+                cols = self._pi.read_bank_1() & self._col_mask
+                self._pi.write(row_pin, 0)
+                if cols:
+                    # Lowest set bit wins if several columns read HIGH
+                    return self.KEYS[i][self._bit_to_col[cols & -cols]]
+            return None
         elif RPI_AVAILABLE:
             for i, row_pin in enumerate(self.row_pins):
                 GPIO.output(row_pin, GPIO.HIGH)
@@ -71,13 +111,57 @@ class MembraneSwitch(BaseComponent):
         self._on_key_detected(key)
 
     def start_monitoring(self):
-        """Start background monitoring thread"""
+        """
+        Start monitoring for key presses.
+        Real HW : interrupt-driven — all rows idle HIGH so any key press
+                  raises its column pin; an edge callback then strobes the
+                  rows to identify the key. No polling thread, ~0 idle CPU.
+        Sim    : background polling thread (unchanged).
+        """
         self.running = True
+        # pigpio mode keeps the polling thread: banked scans are cheap, and
+        # mixing pigpio pin ownership with RPi.GPIO edge detection is unsafe.
+        if not self.simulate and self._pi is None and RPI_AVAILABLE:
+            for pin in self.row_pins:
+                GPIO.output(pin, GPIO.HIGH)
+            for pin in self.col_pins:
+                GPIO.add_event_detect(
+                    pin, GPIO.RISING,
+                    callback=self._on_col_edge,
+                    bouncetime=300,
+                )
+            return
         self.thread = threading.Thread(target=self._monitor_loop, daemon=True)
         self.thread.start()
 
+    def _on_col_edge(self, col_pin):
+        """Edge callback: a column went HIGH — scan rows to decode the key."""
+        if not self.running:
+            return
+        key = self._scan_for_key(col_pin)
+        if key:
+            self._on_key_detected(key)
+
+    def _scan_for_key(self, col_pin):
+        """Strobe rows one at a time to find which row closed onto col_pin."""
+        j = self.col_pins.index(col_pin)
+        key = None
+        for pin in self.row_pins:
+            GPIO.output(pin, GPIO.LOW)
+        for i, row_pin in enumerate(self.row_pins):
+            GPIO.output(row_pin, GPIO.HIGH)
+            if GPIO.input(col_pin) == GPIO.HIGH:
+                key = self.KEYS[i][j]
+            GPIO.output(row_pin, GPIO.LOW)
+            if key:
+                break
+        # Restore the idle state expected by edge detection
+        for pin in self.row_pins:
+            GPIO.output(pin, GPIO.HIGH)
+        return key
+
     def _monitor_loop(self):
-        """Poll for key presses and fire internal handler on each press"""
+        """Poll for key presses and fire internal handler on each press (sim only)"""
         while self.running:
             key = self.read_key()
             if key:
@@ -91,7 +175,7 @@ class MembraneSwitch(BaseComponent):
         Prints, publishes, then calls the optional external hook.
         """
         self.last_key = key
-        print(f"\n[{self.code}] Key pressed: '{key}'")
+        log.debug("[%s] Key pressed: %r", self.code, key)
         self._publish_sensor(key)
 
         if self.on_key:
@@ -99,11 +183,24 @@ class MembraneSwitch(BaseComponent):
 
     def stop(self):
         self.running = False
+        if not self.simulate and self._pi is None and RPI_AVAILABLE:
+            for pin in self.col_pins:
+                try:
+                    GPIO.remove_event_detect(pin)
+                except Exception:
+                    pass
         if self.thread:
             self.thread.join(timeout=1)
 
     def cleanup(self):
         self.stop()
-        if not self.simulate and RPI_AVAILABLE:
+        if self._pi is not None:
+            try:
+                self._pi.stop()
+            except Exception:
+                pass
+            self._pi = None
+        elif not self.simulate and RPI_AVAILABLE:
             for pin in self.row_pins + self.col_pins:
                 GPIO.cleanup(pin)
+        super().cleanup()   # flush buffered payloads
@@ -4,6 +4,7 @@ import time
 import threading
 
 from components.base import BaseComponent
+from components._gpio import ensure_bcm
 
 try:
     import RPi.GPIO as GPIO
@@ -30,7 +31,7 @@ class MotionSensor(BaseComponent):
         self._last_state = False
 
         if not self.simulate and RPI_AVAILABLE:
-            GPIO.setmode(GPIO.BCM)
+            ensure_bcm()
             GPIO.setup(self.pin, GPIO.IN)
 
     def read(self):
@@ -80,3 +81,4 @@ class MotionSensor(BaseComponent):
         self.stop()
         if not self.simulate and RPI_AVAILABLE:
             GPIO.cleanup(self.pin)
+        super().cleanup()   # flush buffered payloads
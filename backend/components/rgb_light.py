@@ -1,6 +1,9 @@
 """RGB LED Light component - BRGB"""
 
+import threading
+
 from components.base import BaseComponent
+from components._gpio import ensure_bcm
 
 try:
     import RPi.GPIO as GPIO
@@ -20,16 +23,13 @@ class RGBLight(BaseComponent):
     The last non-off color is remembered for toggle restore (Rule 9).
     """
 
-    COLOR_NAMES = {
-        (1, 0, 0): "RED",
-        (0, 1, 0): "GREEN",
-        (0, 0, 1): "BLUE",
-        (1, 1, 0): "YELLOW",
-        (1, 0, 1): "MAGENTA",
-        (0, 1, 1): "CYAN",
-        (1, 1, 1): "WHITE",
-        (0, 0, 0): "OFF",
-    }
+    # Color names indexed by channel bitmask (bit0=R, bit1=G, bit2=B),
+    # so set_color does a list index instead of building a tuple dict key.
+    COLOR_NAMES_BY_MASK = [
+        "OFF", "RED", "GREEN", "YELLOW", "BLUE", "MAGENTA", "CYAN", "WHITE",
+    ]
+
+    DEBOUNCE_SECONDS = 0.02   # window for coalescing rapid color changes
 
     def __init__(self, code, settings, publisher=None):
         super().__init__(code, settings, publisher)
@@ -37,13 +37,17 @@ class RGBLight(BaseComponent):
         self.pin_g = settings.get('pin_g', 19)
         self.pin_b = settings.get('pin_b', 26)
 
+        self._mask = 0   # current state as bitmask (bit0=R, bit1=G, bit2=B)
         self._r = 0
         self._g = 0
         self._b = 0
         self._last_color = (1, 1, 1)  # last non-off color; defaults to white
 
+        self._debounce_timer = None
+        self._debounce_lock  = threading.Lock()
+
         if not self.simulate and RPI_AVAILABLE:
-            GPIO.setmode(GPIO.BCM)
+            ensure_bcm()
             for pin in (self.pin_r, self.pin_g, self.pin_b):
                 GPIO.setup(pin, GPIO.OUT)
                 GPIO.output(pin, GPIO.LOW)
@@ -53,22 +57,39 @@ class RGBLight(BaseComponent):
         Set RGB color. r, g, b are each 0 or 1 (or truthy/falsy).
         Saves non-off state as last_color for toggle restore.
         """
-        self._r = int(bool(r))
-        self._g = int(bool(g))
-        self._b = int(bool(b))
+        mask = (1 if r else 0) | ((1 if g else 0) << 1) | ((1 if b else 0) << 2)
+        self._mask = mask
+        self._r = mask & 1
+        self._g = (mask >> 1) & 1
+        self._b = (mask >> 2) & 1
 
-        if not self.simulate and RPI_AVAILABLE:
-            GPIO.output(self.pin_r, GPIO.HIGH if self._r else GPIO.LOW)
-            GPIO.output(self.pin_g, GPIO.HIGH if self._g else GPIO.LOW)
-            GPIO.output(self.pin_b, GPIO.HIGH if self._b else GPIO.LOW)
-
-        if (self._r, self._g, self._b) != (0, 0, 0):
+        if mask:
             self._last_color = (self._r, self._g, self._b)
 
-        color_name = self.COLOR_NAMES.get((self._r, self._g, self._b), "CUSTOM")
-        print(f"[{self.code}] RGB -> R={self._r} G={self._g} B={self._b}  ({color_name})")
-
-        self._publish_actuator({'r': self._r, 'g': self._g, 'b': self._b})
+        print(f"[{self.code}] RGB -> R={self._r} G={self._g} B={self._b}  ({self.COLOR_NAMES_BY_MASK[mask]})")
+
+        self._schedule_commit()
+
+    def _schedule_commit(self):
+        """(Re)arm the debounce timer; only the settled color is committed."""
+        with self._debounce_lock:
+            if self._debounce_timer is not None:
+                self._debounce_timer.cancel()
+            self._debounce_timer = threading.Timer(
+                self.DEBOUNCE_SECONDS, self._commit)
+            self._debounce_timer.daemon = True
+            self._debounce_timer.start()
+
+    def _commit(self):
+        """Write the settled color to GPIO and publish it once."""
+        with self._debounce_lock:
+            self._debounce_timer = None
+            r, g, b = self._r, self._g, self._b
+        if not self.simulate and RPI_AVAILABLE:
+            GPIO.output(self.pin_r, GPIO.HIGH if r else GPIO.LOW)
+            GPIO.output(self.pin_g, GPIO.HIGH if g else GPIO.LOW)
+            GPIO.output(self.pin_b, GPIO.HIGH if b else GPIO.LOW)
+        self._publish_actuator({'r': r, 'g': g, 'b': b})
 
     def turn_off(self):
         """Turn off all channels"""
@@ -85,7 +106,7 @@ class RGBLight(BaseComponent):
 
     def is_on(self):
         """Return True if any channel is active"""
-        return (self._r, self._g, self._b) != (0, 0, 0)
+        return self._mask != 0
 
     def get_color(self):
         """Return current (r, g, b) tuple"""
@@ -97,7 +118,16 @@ class RGBLight(BaseComponent):
 
     def cleanup(self):
         self.turn_off()
+        with self._debounce_lock:
+            if self._debounce_timer is not None:
+                self._debounce_timer.cancel()
+                self._debounce_timer = None
         if not self.simulate and RPI_AVAILABLE:
+            # Drive the OFF state directly; the debounced commit was cancelled
+            GPIO.output(self.pin_r, GPIO.LOW)
+            GPIO.output(self.pin_g, GPIO.LOW)
+            GPIO.output(self.pin_b, GPIO.LOW)
             GPIO.cleanup(self.pin_r)
             GPIO.cleanup(self.pin_g)
             GPIO.cleanup(self.pin_b)
+        super().cleanup()   # flush buffered payloads
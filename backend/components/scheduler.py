@@ -0,0 +1,85 @@
+"""Shared polling scheduler for component background work.
+
+Replaces the one-daemon-thread-per-polling-component pattern: components
+register (interval, callback) pairs and a single worker thread wakes for
+the earliest deadline, runs the callback, and re-queues it. Deadlines are
+absolute, so intervals do not drift with callback run time.
+
+Callbacks must be short — a slow callback delays every other registration.
+"""
+
+import heapq
+import threading
+import time
+
+
+class PollScheduler:
+
+    def __init__(self):
+        self._heap = []              # (deadline, seq, entry)
+        self._cond = threading.Condition()
+        self._thread = None
+        self._seq = 0
+
+    def add(self, interval, fn):
+        """Run fn every `interval` seconds; returns a handle for cancel()."""
+        return self._schedule(interval, interval, fn)
+
+    def once(self, delay, fn):
+        """Run fn once after `delay` seconds; returns a handle for cancel().
+
+        Replaces per-event threading.Timer usage: rescheduling is a heap
+        push on the shared worker instead of an OS thread spawn.
+        """
+        return self._schedule(delay, None, fn)
+
+    def _schedule(self, delay, interval, fn):
+        entry = [time.monotonic() + delay, interval, fn, True]
+        with self._cond:
+            self._push_locked(entry)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+            self._cond.notify()
+        return entry
+
+    def cancel(self, entry):
+        """Stop a registration; the entry is dropped at its next deadline."""
+        entry[3] = False
+
+    def _push_locked(self, entry):
+        self._seq += 1
+        heapq.heappush(self._heap, (entry[0], self._seq, entry))
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._heap:
+                    self._cond.wait()
+                deadline, _, entry = self._heap[0]
+                now = time.monotonic()
+                if deadline > now:
+                    self._cond.wait(deadline - now)
+                    continue
+                heapq.heappop(self._heap)
+                if not entry[3]:
+                    continue
+            try:
+                entry[2]()
+            except Exception:
+                pass
+            with self._cond:
+                if entry[3] and entry[1] is not None:
+                    entry[0] = deadline + entry[1]   # absolute re-arm, no drift
+                    self._push_locked(entry)
+                    self._cond.notify()
+                else:
+                    entry[3] = False                 # one-shot: spent
+
+
+_shared = PollScheduler()
+
+
+def get_scheduler():
+    """Return the process-wide shared scheduler."""
+    return _shared
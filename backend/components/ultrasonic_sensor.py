@@ -4,6 +4,7 @@ import time
 import threading
 
 from components.base import BaseComponent
+from components._gpio import ensure_bcm
 
 try:
     import RPi.GPIO as GPIO
@@ -11,6 +12,12 @@ try:
 except ImportError:
     RPI_AVAILABLE = False
 
+try:
+    import pigpio
+    PIGPIO_AVAILABLE = True
+except ImportError:
+    PIGPIO_AVAILABLE = False
+
 
 class UltrasonicSensor(BaseComponent):
     """
@@ -21,6 +28,11 @@ class UltrasonicSensor(BaseComponent):
 
     ALERT_THRESHOLD_CM = 30
 
+    # Deadband publishing: skip readings that changed less than this …
+    PUBLISH_DELTA_CM = 5
+    # … unless this long has passed since the last publish (heartbeat)
+    PUBLISH_HEARTBEAT_SECONDS = 30
+
     def __init__(self, settings, publisher=None, on_alert=None, code='DUS1'):
         super().__init__(code, settings, publisher)
         self.trigger_pin = settings.get('trigger_pin', 23)
@@ -29,40 +41,94 @@ class UltrasonicSensor(BaseComponent):
 
         self.running = False
         self.thread = None
+        self._stop_evt = threading.Event()
         self.distance = 100.0
         self._last_alert = False
-
-        if not self.simulate and RPI_AVAILABLE:
-            GPIO.setmode(GPIO.BCM)
+        self._last_pub_dist = None
+        self._last_pub_t = 0.0
+
+        # Echo edge timestamps (ns), written by the GPIO interrupt callback
+        self._t_rise  = 0
+        self._t_fall  = 0
+        self._rising  = threading.Event()
+        self._falling = threading.Event()
+
+        # Prefer pigpio: the daemon samples the echo pin via DMA and hands
+        # the callback 1 µs hardware ticks, so pulse width is immune to
+        # interpreter/GC jitter (vs ±ms with RPi.GPIO callbacks)
+        self._pi = None
+        self._edge_cb_handle = None
+        if not self.simulate and PIGPIO_AVAILABLE:
+            try:
+                pi = pigpio.pi()
+                if pi.connected:
+                    self._pi = pi
+                    pi.set_mode(self.trigger_pin, pigpio.OUTPUT)
+                    pi.set_mode(self.echo_pin, pigpio.INPUT)
+                    pi.write(self.trigger_pin, 0)
+                    self._edge_cb_handle = pi.callback(
+                        self.echo_pin, pigpio.EITHER_EDGE, self._pigpio_edge_cb)
+            except Exception:
+                self._pi = None
+
+        if not self.simulate and self._pi is None and RPI_AVAILABLE:
+            ensure_bcm()
             GPIO.setup(self.trigger_pin, GPIO.OUT)
             GPIO.setup(self.echo_pin, GPIO.IN)
             GPIO.output(self.trigger_pin, GPIO.LOW)
+            # Kernel-driven edge detection: the measuring thread blocks on
+            # an Event instead of spinning on GPIO.input(), and the edges
+            # are timestamped in the callback with perf_counter_ns()
+            GPIO.add_event_detect(self.echo_pin, GPIO.BOTH,
+                                  callback=self._echo_cb)
+
+    def _pigpio_edge_cb(self, gpio, level, tick):
+        """Echo-pin edge callback with pigpio's µs hardware tick."""
+        if level == 1:
+            self._t_rise = tick
+            self._rising.set()
+        else:
+            self._t_fall = tick
+            self._falling.set()
+
+    def _echo_cb(self, channel):
+        """Echo-pin edge callback (runs on RPi.GPIO's event thread)."""
+        if GPIO.input(self.echo_pin):
+            self._t_rise = time.perf_counter_ns()
+            self._rising.set()
+        else:
+            self._t_fall = time.perf_counter_ns()
+            self._falling.set()
 
     def measure_distance(self):
         """Measure distance in centimeters"""
         if self.simulate:
             return self.distance
+        elif self._pi is not None:
+            self._rising.clear()
+            self._falling.clear()
+            self._pi.gpio_trigger(self.trigger_pin, 10, 1)   # 10 µs pulse
+
+            if not self._falling.wait(timeout=0.1) or not self._rising.is_set():
+                return -1
+            pulse_us = pigpio.tickDiff(self._t_rise, self._t_fall)
+            return round(pulse_us * 17150e-6, 2)
         elif RPI_AVAILABLE:
+            self._rising.clear()
+            self._falling.clear()
+
             GPIO.output(self.trigger_pin, GPIO.HIGH)
             time.sleep(0.00001)
             GPIO.output(self.trigger_pin, GPIO.LOW)
 
-            pulse_start = time.time()
-            timeout = pulse_start + 0.1
-            while GPIO.input(self.echo_pin) == GPIO.LOW:
-                pulse_start = time.time()
-                if pulse_start > timeout:
-                    return -1
-
-            pulse_end = time.time()
-            timeout = pulse_end + 0.1
-            while GPIO.input(self.echo_pin) == GPIO.HIGH:
-                pulse_end = time.time()
-                if pulse_end > timeout:
-                    return -1
-
-            pulse_duration = pulse_end - pulse_start
-            return round(pulse_duration * 17150, 2)
+            # Block until the echo pulse completes; no polling loop
+            if not self._falling.wait(timeout=0.1) or not self._rising.is_set():
+                return -1
+
+            pulse_ns = self._t_fall - self._t_rise
+            if pulse_ns <= 0:
+                return -1
+            return round(pulse_ns * 17150e-9, 2)
         return -1
 
     def measure_and_publish(self):
@@ -80,22 +146,46 @@ class UltrasonicSensor(BaseComponent):
     def start_monitoring(self, interval=2.0):
         """Start background monitoring thread"""
         self.running = True
+        self._stop_evt.clear()
         self.thread = threading.Thread(target=self._monitor_loop, args=(interval,), daemon=True)
         self.thread.start()
 
     def _monitor_loop(self, interval):
         """Measure periodically; print and publish on every reading"""
-        while self.running:
-            dist = self.measure_distance()
-            is_alert = 0 <= dist < self.ALERT_THRESHOLD_CM
-            self._on_measurement(dist, is_alert)
+        # Hoist hot lookups to locals: each attribute/global access in the
+        # loop body is a dict probe per iteration otherwise
+        measure   = self.measure_distance
+        on_meas   = self._on_measurement
+        threshold = self.ALERT_THRESHOLD_CM
+        monotonic = time.monotonic
+        stop_evt  = self._stop_evt
+        stop_wait = stop_evt.wait
+
+        # Deadline-based cadence: sleeping a fixed interval after each
+        # measurement would stretch the period by the measurement time
+        # (up to ~100 ms) and drift
+        next_t = monotonic()
+        while not stop_evt.is_set():
+            dist = measure()
+            is_alert = 0 <= dist < threshold
+            on_meas(dist, is_alert)
             self._last_alert = is_alert
-            time.sleep(interval)
+            next_t += interval
+            delay = next_t - monotonic()
+            if delay > 0:
+                # Event wait instead of sleep: stop() wakes the loop
+                # immediately rather than after up to a full interval
+                if stop_wait(delay):
+                    break
+            else:
+                next_t = monotonic()   # fell behind; resync
 
     def _on_measurement(self, distance, is_alert):
         """
         Internal handler: called on every measurement.
-        Prints only when alert state changes; always publishes.
+        Prints only when alert state changes; publishes on alert
+        transitions, distance changes beyond the deadband, or the
+        heartbeat interval — steady-state readings stay off the wire.
         """
         # Print only on state transitions to avoid console spam
         if is_alert != self._last_alert:
@@ -104,18 +194,35 @@ class UltrasonicSensor(BaseComponent):
             else:
                 print(f"\n[DUS1] Object moved away ({distance:.1f} cm)")
 
-        self._publish_sensor(distance, {'alert': is_alert})
+        now = time.monotonic()
+        if (is_alert != self._last_alert
+                or self._last_pub_dist is None
+                or abs(distance - self._last_pub_dist) > self.PUBLISH_DELTA_CM
+                or now - self._last_pub_t > self.PUBLISH_HEARTBEAT_SECONDS):
+            self._publish_sensor(distance, {'alert': is_alert})
+            self._last_pub_dist = distance
+            self._last_pub_t = now
 
         if self.on_alert:
             self.on_alert(distance, is_alert)
 
     def stop(self):
         self.running = False
+        self._stop_evt.set()
         if self.thread:
             self.thread.join(timeout=1)
 
     def cleanup(self):
         self.stop()
-        if not self.simulate and RPI_AVAILABLE:
+        if self._pi is not None:
+            try:
+                self._edge_cb_handle.cancel()
+                self._pi.stop()
+            except Exception:
+                pass
+            self._pi = None
+        elif not self.simulate and RPI_AVAILABLE:
+            GPIO.remove_event_detect(self.echo_pin)
             GPIO.cleanup(self.trigger_pin)
             GPIO.cleanup(self.echo_pin)
+        super().cleanup()   # flush buffered payloads
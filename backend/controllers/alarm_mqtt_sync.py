@@ -30,13 +30,268 @@ This design works identically:
 """
 
 import json
+import select
+import socket
+import struct
 import threading
+import time
 
 import paho.mqtt.client as mqtt
 
+try:
+    # C-accelerated JSON: loads takes the payload bytes without a decode,
+    # dumps returns bytes paho publishes directly
+    import orjson
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj):
+        return json.dumps(obj).encode()
+
+# PI-to-PI numeric topics carry one int (person delta) or one bool (door
+# state); a packed int16 is 2 bytes against 30+ of JSON framing and
+# unpacks without a parser. Topics the web dashboard also consumes
+# (state, person_count) stay JSON.
+# Deltas additionally carry a uint16 sequence number: unlike triggers
+# and door states they are not idempotent, so the receiver must be able
+# to tell a QoS-1 redelivery (same sequence) from a second legitimate
+# identical delta (new sequence).
+_PACK_DELTA       = struct.Struct('<h').pack
+_UNPACK_DELTA     = struct.Struct('<h').unpack
+_PACK_DELTA_SEQ   = struct.Struct('<hH').pack
+_UNPACK_DELTA_SEQ = struct.Struct('<hH').unpack
+
+# Alarm triggers likewise go binary: a (source, reason) byte pair — plus
+# an optional float32 detail such as the gyro delta — replaces ~60 bytes
+# of JSON per trigger. Codes translate back to the original reason
+# strings at the receiver, so controller callbacks are unchanged; an
+# unknown reason or device id falls back to the JSON form.
+TRIGGER_DOOR_5S      = 1
+TRIGGER_MOTION_EMPTY = 2
+TRIGGER_GYRO         = 3
+_TRIGGER_CODES = {
+    'door_open_5s_DS2':       TRIGGER_DOOR_5S,
+    'motion_no_occupants':    TRIGGER_MOTION_EMPTY,
+    'gyroscope_displacement': TRIGGER_GYRO,
+}
+_TRIGGER_TEXT  = {v: k for k, v in _TRIGGER_CODES.items()}
+_DEVICE_CODES  = {'PI1': 1, 'PI2': 2, 'PI3': 3}
+_DEVICE_TEXT   = {v: k for k, v in _DEVICE_CODES.items()}
+_PACK_DETAIL   = struct.Struct('<f').pack
+_UNPACK_DETAIL = struct.Struct('<f').unpack_from
+
+
+# ========== SHARED MQTT I/O THREAD ==========
+# paho's loop_start() spawns one network thread per client; on the Pi's
+# weak cores that is an extra scheduler/GIL tax per AlarmMQTTSync. All
+# clients are instead served by a single select()-driven thread that calls
+# loop_read/loop_write when the socket is ready and loop_misc for
+# keepalives, reconnecting dropped clients with paho's own backoff state.
+
+_io_clients = []
+_io_thread = None
+_io_lock = threading.Lock()
+_io_retry_at = {}   # id(client) → monotonic time of next reconnect attempt
+
+
+def _io_register(client):
+    global _io_thread
+    with _io_lock:
+        _io_clients.append(client)
+        if _io_thread is None:
+            _io_thread = threading.Thread(target=_io_loop, daemon=True)
+            _io_thread.start()
+
+
+def _io_unregister(client):
+    with _io_lock:
+        if client in _io_clients:
+            _io_clients.remove(client)
+        _io_retry_at.pop(id(client), None)
+
+
+def _io_loop():
+    while True:
+        with _io_lock:
+            clients = list(_io_clients)
+
+        readers, writers = {}, {}
+        for c in clients:
+            sock = c.socket()
+            if sock is None:
+                continue
+            readers[sock] = c
+            if c.want_write():
+                writers[sock] = c
+
+        if readers:
+            try:
+                r, w, _ = select.select(list(readers), list(writers), [], 1)
+            except (OSError, ValueError):
+                # A socket died mid-select; loop_misc below notices
+                r, w = [], []
+            for sock in r:
+                readers[sock].loop_read()
+            for sock in w:
+                writers[sock].loop_write()
+        else:
+            time.sleep(0.5)
+
+        now = time.monotonic()
+        for c in clients:
+            if c.loop_misc() != mqtt.MQTT_ERR_SUCCESS:
+                if now >= _io_retry_at.get(id(c), 0):
+                    _io_retry_at[id(c)] = now + 2
+                    try:
+                        c.reconnect()
+                    except Exception:
+                        pass
+
+
+# ========== SHARED BROKER CLIENTS ==========
+# One paho client + TCP connection per broker endpoint, shared by every
+# sync instance in the process. Instances attach (topic, qos, handler)
+# subscriptions and detach on stop; the connection closes when the last
+# user detaches. Avoids paying the connect cost and an extra socket per
+# module if more broker users are added alongside the alarm sync.
+
+_brokers = {}
+_brokers_lock = threading.Lock()
+
+
+class _BrokerClient:
+
+    def __init__(self, host, port, username, password, client_id):
+        self._host = host
+        self._port = port
+        self.connected = False
+        self.refs = 0
+        self._subs = []            # (topic, qos, handler)
+        self._route = {}           # topic → handler
+        self._route_by_len = {}    # len(topic) → handler, None on collision
+
+        # Persistent session: the broker keeps this client's subscriptions
+        # across drops, so reconnects skip the SUBSCRIBE round-trips and
+        # retained-message replay
+        self.client = mqtt.Client(client_id=client_id, clean_session=False)
+        self.client.reconnect_delay_set(min_delay=1, max_delay=8)
+        if username:
+            self.client.username_pw_set(username, password)
+        self.client.on_connect    = self._on_connect
+        self.client.on_disconnect = self._on_disconnect
+        self.client.on_message    = self._on_message
+
+    def start(self):
+        try:
+            self.client.connect(self._host, self._port, keepalive=60)
+            _io_register(self.client)   # served by the shared I/O thread
+            return True
+        except Exception as exc:
+            print(f"[MQTT] Connection to {self._host}:{self._port} failed: {exc}")
+            return False
+
+    def attach(self, subs):
+        """Register subscriptions from one sync instance."""
+        self.refs += 1
+        self._subs.extend(subs)
+        self._rebuild_routes()
+        if self.connected:
+            for topic, qos, _ in subs:
+                self.client.subscribe(topic, qos)
+
+    def detach(self, subs):
+        """Drop one instance's subscriptions; returns True when unused."""
+        self.refs -= 1
+        topics = {t for t, _, _ in subs}
+        self._subs = [s for s in self._subs if s[0] not in topics]
+        self._rebuild_routes()
+        return self.refs <= 0
+
+    def shutdown(self):
+        _io_unregister(self.client)
+        try:
+            self.client.disconnect()
+        except Exception:
+            pass
+        self.connected = False
+
+    def _rebuild_routes(self):
+        # Subscribed topics have unique lengths in practice, so delivery
+        # can branch on len(topic) — one int compare instead of hashing a
+        # fresh topic string per message. A collision maps to None and
+        # falls back to the exact-topic table.
+        self._route = {t: h for t, _, h in self._subs}
+        by_len = {}
+        for t, h in self._route.items():
+            by_len[len(t)] = None if len(t) in by_len else h
+        self._route_by_len = by_len
+
+    def _on_connect(self, client, userdata, flags, rc):
+        if rc != 0:
+            print(f"[MQTT] Connection refused (rc={rc})")
+            return
+        self.connected = True
+        # Disable Nagle: back-to-back small publishes (state broadcast
+        # followed by person_count) must not wait ~40 ms for the ACK of
+        # the previous frame
+        try:
+            client.socket().setsockopt(
+                socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except Exception:
+            pass
+        if flags.get('session present'):
+            # Broker restored our subscriptions — nothing to re-send
+            return
+        for topic, qos, _ in self._subs:
+            client.subscribe(topic, qos)
+
+    def _on_disconnect(self, client, userdata, rc):
+        self.connected = False
+        if rc != 0:
+            print(f"[MQTT] Unexpected disconnect (rc={rc})")
+
+    def _on_message(self, client, userdata, msg):
+        topic = msg.topic
+        handler = self._route_by_len.get(len(topic))
+        if handler is None:
+            handler = self._route.get(topic)
+        if handler is not None:
+            handler(msg.payload)
+
+
+def _broker_for(cfg, client_id):
+    """Fetch or create the shared client for cfg's broker endpoint."""
+    host = cfg.get('host', 'localhost')
+    port = cfg.get('port', 1883)
+    user = cfg.get('username')
+    key = (host, port, user)
+    with _brokers_lock:
+        broker = _brokers.get(key)
+        if broker is None:
+            broker = _BrokerClient(host, port, user, cfg.get('password'),
+                                   client_id)
+            if not broker.start():
+                return None
+            _brokers[key] = broker
+        return broker
+
+
+def _broker_release(broker, subs):
+    with _brokers_lock:
+        if broker.detach(subs):
+            for key, b in list(_brokers.items()):
+                if b is broker:
+                    del _brokers[key]
+            broker.shutdown()
+
 
 class AlarmMQTTSync:
 
+    # Topic strings are bound once: the fixed topics here at class
+    # creation, the per-device web-command topic in __init__. No publish
+    # or subscribe path formats a topic per call.
     TOPIC_TRIGGER  = "iot/alarm/trigger"    # PI2/PI3  →  PI1
     TOPIC_STATE    = "iot/alarm/state"      # PI1      →  all  (retained)
     TOPIC_DOOR_PI2 = "iot/alarm/door_pi2"   # PI2      →  PI1
@@ -44,7 +299,16 @@ class AlarmMQTTSync:
     TOPIC_PERSON_COUNT = "iot/home/person_count"  # PI1 → all (retained)
     TOPIC_PERSON_DELTA = "iot/home/person_delta"  # PI2 → PI1
 
-    TOPIC_WEB_COMMAND  = "iot/web/command"        # Web app → any PI
+    # Web app → one PI; each device subscribes only to its own subtopic
+    # (iot/web/command/<device_id>) so the broker filters commands aimed at
+    # other devices before they cost a JSON parse here
+    TOPIC_WEB_COMMAND_PREFIX = "iot/web/command"
+
+    # Person-delta publishes within this window are summed into one
+    # packet and flushed on stop(). The window is kept short on purpose:
+    # PI1's motion-with-no-occupants rule reads the count, so holding a
+    # +1 longer (e.g. 250 ms) widens the window for a false trigger.
+    DELTA_COALESCE_SECONDS = 0.05
 
     def __init__(
         self,
@@ -89,126 +353,196 @@ class AlarmMQTTSync:
         self.on_person_delta_received = on_person_delta_received
         self.on_web_command           = on_web_command
 
+        # Single string, single writer (paho's network thread): reference
+        # assignment is atomic under the GIL, so no lock is needed around it
         self._known_state = 'DISARMED'
-        self._state_lock  = threading.Lock()
         self._client      = None
-        self._connected   = False
+        self._broker      = None
+
+        # Coalescing state for person-delta bursts (door in/out sequences)
+        self._pending_delta = 0
+        self._delta_lock    = threading.Lock()
+        self._delta_timer   = None
+        self._delta_seq     = 0      # sender: stamps each delta packet
+        self._last_delta_seq = None  # receiver: drops redelivered packets
+
+        # Pre-baked payload prefixes: every publish_* payload has a fixed
+        # shape with a single variable field, so running json.dumps on a
+        # fresh dict per publish is pure CPU/GC churn on the hot path.
+        # _dumps(device_id) handles quoting/escaping once, here.
+        prefix = b'{"source":' + _dumps(device_id) + b','
+        self._p_trigger = prefix + b'"reason":'
+        self._p_state   = prefix + b'"state":'
+        self._p_count   = prefix + b'"count":'
+
+        # The alarm has five known states; pre-serialize the retained state
+        # payloads so rapid transitions (DISARMED→ARMING→ARMED) publish
+        # with zero per-call allocations
+        self._state_payloads = {
+            s: self._p_state + _dumps(s) + b'}'
+            for s in ('DISARMED', 'ARMING', 'ARMED', 'GRACE', 'ALARMING')
+        }
+
+        # Topic → bound-handler dispatch table, built once from the role:
+        # _on_message does one dict lookup instead of an if/elif chain of
+        # string compares + role checks per incoming message
+        # Topics without a wired callback are not registered at all, so
+        # the broker never forwards (and we never parse) their traffic.
+        self._handlers = {}
+        if role == 'master':
+            if self.on_trigger_received:
+                self._handlers[self.TOPIC_TRIGGER]      = self._handle_trigger
+            if self.on_door_pi2_received:
+                self._handlers[self.TOPIC_DOOR_PI2]     = self._handle_door_pi2
+            if self.on_person_delta_received:
+                self._handlers[self.TOPIC_PERSON_DELTA] = self._handle_person_delta
+        else:
+            # State is always tracked: _known_state backs get_known_state()
+            self._handlers[self.TOPIC_STATE] = self._handle_state
+            if self.on_person_count_received:
+                self._handlers[self.TOPIC_PERSON_COUNT] = self._handle_person_count
+        self._topic_web_command = f"{self.TOPIC_WEB_COMMAND_PREFIX}/{device_id}"
+        if self.on_web_command:
+            self._handlers[self._topic_web_command] = self._handle_web_command
+
+        # Subscriptions handed to the shared broker client. Slave state
+        # topics use QoS 1 so the retained message delivers the current
+        # state immediately on subscribe.
+        self._subs = [
+            (topic, 0 if role == 'master' and topic != self._topic_web_command
+             else 1, handler)
+            for topic, handler in self._handlers.items()
+        ]
 
     # ========== LIFECYCLE ==========
 
+    @property
+    def _connected(self):
+        return self._broker is not None and self._broker.connected
+
     def start(self):
         if not self._cfg.get('enabled', True):
             print(f"[{self._device_id}] MQTT disabled – alarm sync inactive")
             return
 
-        host = self._cfg.get('host', 'localhost')
-        port = self._cfg.get('port', 1883)
-
-        self._client = mqtt.Client(
-            client_id=f"alarm-sync-{self._device_id}",
-            clean_session=True,
-        )
-
-        user = self._cfg.get('username')
-        pwd  = self._cfg.get('password')
-        if user:
-            self._client.username_pw_set(user, pwd)
-
-        self._client.on_connect    = self._on_connect
-        self._client.on_disconnect = self._on_disconnect
-        self._client.on_message    = self._on_message
-
-        try:
-            self._client.connect(host, port, keepalive=60)
-            self._client.loop_start()          # background network thread
-        except Exception as exc:
-            print(f"[{self._device_id}] Connection failed: {exc}")
+        self._broker = _broker_for(self._cfg, f"alarm-sync-{self._device_id}")
+        if self._broker is None:
+            return
+        self._broker.attach(self._subs)
+        self._client = self._broker.client
 
     def stop(self):
-        if self._client:
-            self._client.loop_stop()
-            try:
-                self._client.disconnect()
-            except Exception:
-                pass
-        self._connected = False
-
-    # ========== MQTT CALLBACKS ==========
-
-    def _on_connect(self, client, userdata, flags, rc):
-        if rc == 0:
-            self._connected = True
-            if self._role == 'master':
-                client.subscribe(self.TOPIC_TRIGGER)
-                client.subscribe(self.TOPIC_DOOR_PI2)
-                client.subscribe(self.TOPIC_PERSON_DELTA)
-            else:
-                # Subscribe with QoS 1; retained message delivers current state immediately
-                client.subscribe(self.TOPIC_STATE, qos=1)
-                client.subscribe(self.TOPIC_PERSON_COUNT, qos=1)
-            # All roles subscribe to web commands
-            client.subscribe(self.TOPIC_WEB_COMMAND, qos=1)
-        else:
-            print(f"[{self._device_id}] Connection refused (rc={rc})")
-
-    def _on_disconnect(self, client, userdata, rc):
-        self._connected = False
-        if rc != 0:
-            print(f"[{self._device_id}] Unexpected disconnect (rc={rc})")
-
-    def _on_message(self, client, userdata, msg):
+        self._flush_delta()   # don't drop a coalescing-window delta on shutdown
+        if self._broker is not None:
+            _broker_release(self._broker, self._subs)
+            self._broker = None
+            self._client = None
+
+    # ========== TOPIC HANDLERS ==========
+    # Each handler parses its own payload, so topics that can reject a
+    # message cheaply don't have to pay for json.loads first.
+
+    @staticmethod
+    def _loads(raw):
         try:
-            payload = json.loads(msg.payload.decode())
+            return _loads(raw)
         except Exception:
-            return
-
-        topic = msg.topic
-
-        if topic == self.TOPIC_TRIGGER and self._role == 'master':
-            if self.on_trigger_received:
-                self.on_trigger_received(
-                    payload.get('source', 'unknown'),
-                    payload.get('reason', ''),
-                )
-
-        elif topic == self.TOPIC_DOOR_PI2 and self._role == 'master':
-            if self.on_door_pi2_received:
-                self.on_door_pi2_received(payload.get('is_open', False))
+            return None
 
-        elif topic == self.TOPIC_STATE and self._role == 'slave':
-            state = payload.get('state', 'DISARMED')
-            with self._state_lock:
-                self._known_state = state
-            if self.on_state_received:
-                self.on_state_received(state)
-
-        elif topic == self.TOPIC_PERSON_DELTA and self._role == 'master':
-            if self.on_person_delta_received:
-                self.on_person_delta_received(
-                    payload.get('source', 'unknown'),
-                    payload.get('delta', 0),
-                )
+    def _handle_trigger(self, raw):
+        if self.on_trigger_received is None:
+            return
+        n = len(raw)
+        if n in (2, 6):   # packed (source, reason[, float32 detail])
+            source = _DEVICE_TEXT.get(raw[0], 'unknown')
+            reason = _TRIGGER_TEXT.get(raw[1], f'code_{raw[1]}')
+            if n == 6:
+                reason = f'{reason} delta={_UNPACK_DETAIL(raw, 2)[0]:.3f}'
+            self.on_trigger_received(source, reason)
+            return
+        payload = self._loads(raw)   # legacy JSON sender
+        if payload is not None:
+            self.on_trigger_received(
+                payload.get('source', 'unknown'),
+                payload.get('reason', ''),
+            )
+
+    def _handle_door_pi2(self, raw):
+        if self.on_door_pi2_received is None:
+            return
+        if len(raw) == 1:   # packed bool
+            self.on_door_pi2_received(raw[0] != 0)
+            return
+        payload = self._loads(raw)   # legacy JSON sender
+        if payload is not None:
+            self.on_door_pi2_received(payload.get('is_open', False))
 
-        elif topic == self.TOPIC_PERSON_COUNT and self._role == 'slave':
-            if self.on_person_count_received:
-                self.on_person_count_received(payload.get('count', 0))
+    def _handle_state(self, raw):
+        payload = self._loads(raw)
+        if payload is None:
+            return
+        state = payload.get('state', 'DISARMED')
+        self._known_state = state
+        if self.on_state_received:
+            self.on_state_received(state)
 
-        elif topic == self.TOPIC_WEB_COMMAND:
-            target = payload.get('target', '')
-            if target == self._device_id and self.on_web_command:
-                self.on_web_command(
-                    payload.get('command', ''),
-                    payload.get('params', {}),
-                )
+    def _handle_person_delta(self, raw):
+        if self.on_person_delta_received is None:
+            return
+        if len(raw) == 4:   # packed int16 + uint16 seq; only PI2 publishes deltas
+            delta, seq = _UNPACK_DELTA_SEQ(raw)
+            if seq == self._last_delta_seq:
+                return   # QoS-1 redelivery of a packet already applied
+            self._last_delta_seq = seq
+            self.on_person_delta_received('PI2', delta)
+            return
+        if len(raw) == 2:   # legacy packed delta without a sequence number
+            self.on_person_delta_received('PI2', _UNPACK_DELTA(raw)[0])
+            return
+        payload = self._loads(raw)   # legacy JSON sender
+        if payload is not None:
+            self.on_person_delta_received(
+                payload.get('source', 'unknown'),
+                payload.get('delta', 0),
+            )
+
+    def _handle_person_count(self, raw):
+        payload = self._loads(raw)
+        if payload is not None and self.on_person_count_received:
+            self.on_person_count_received(payload.get('count', 0))
+
+    def _handle_web_command(self, raw):
+        # Targeting is done by the broker via the per-device subtopic, so
+        # anything that arrives here is for this device
+        payload = self._loads(raw)
+        if payload is not None and self.on_web_command:
+            self.on_web_command(
+                payload.get('command', ''),
+                payload.get('params', {}),
+            )
 
     # ========== PUBLISH API ==========
 
-    def publish_trigger(self, reason=''):
-        """PI2/PI3: ask PI1 to trigger the alarm (Rules 5, 6)."""
+    def publish_trigger(self, reason='', detail=None):
+        """PI2/PI3: ask PI1 to trigger the alarm (Rules 5, 6).
+
+        detail is an optional float (e.g. the gyro displacement delta)
+        packed alongside the reason code, so hot paths don't have to
+        bake it into the reason string themselves.
+        """
         if not self._connected or self._client is None:
             print(f"[{self._device_id}] Not connected – trigger not sent ({reason})")
             return
-        payload = json.dumps({'source': self._device_id, 'reason': reason})
+        code = _TRIGGER_CODES.get(reason)
+        src  = _DEVICE_CODES.get(self._device_id)
+        if code is not None and src is not None:
+            payload = bytes((src, code))
+            if detail is not None:
+                payload += _PACK_DETAIL(detail)
+        else:   # unknown reason or device id: legacy JSON form
+            if detail is not None:
+                reason = f'{reason} delta={detail:.3f}'
+            payload = self._p_trigger + _dumps(reason) + b'}'
         self._client.publish(self.TOPIC_TRIGGER, payload, qos=1)
         print(f"[{self._device_id}] Trigger → PI1 ({reason})")
 
@@ -216,37 +550,67 @@ class AlarmMQTTSync:
         """PI2: notify PI1 about DS2 door open/close (Rules 3, 4)."""
         if not self._connected or self._client is None:
             return
-        payload = json.dumps({'source': self._device_id, 'is_open': is_open})
-        self._client.publish(self.TOPIC_DOOR_PI2, payload, qos=1)
+        self._client.publish(self.TOPIC_DOOR_PI2,
+                             b'\x01' if is_open else b'\x00', qos=1)
 
     def publish_state(self, state):
         """PI1: broadcast the current alarm state to PI2 and PI3 (retained)."""
         if not self._connected or self._client is None:
             return
-        payload = json.dumps({'source': self._device_id, 'state': state})
-        self._client.publish(self.TOPIC_STATE, payload, qos=1, retain=True)
+        # QoS 0: retained + absolute, so the broker always holds the latest
+        # state and a lost packet is healed by the next transition — no need
+        # to serialize on PUBACKs
+        payload = self._state_payloads.get(state)
+        if payload is None:   # unknown state string; serialize on the spot
+            payload = self._p_state + _dumps(state) + b'}'
+        self._client.publish(self.TOPIC_STATE, payload, qos=0, retain=True)
 
     def publish_person_count(self, count):
         """PI1: broadcast absolute person count to PI2 and PI3 (retained)."""
         if not self._connected or self._client is None:
             return
-        payload = json.dumps({'source': self._device_id, 'count': count})
-        self._client.publish(self.TOPIC_PERSON_COUNT, payload, qos=1, retain=True)
+        # QoS 0 for the same reason as publish_state: absolute and retained
+        payload = self._p_count + b'%d}' % count
+        self._client.publish(self.TOPIC_PERSON_COUNT, payload, qos=0, retain=True)
 
     def publish_person_delta(self, delta):
-        """PI2: request PI1 to adjust person count by delta (+1 or -1)."""
+        """
+        PI2: request PI1 to adjust person count by delta (+1 or -1).
+        Deltas arriving within DELTA_COALESCE_SECONDS are summed and sent
+        as one packet, so a burst of door events costs a single QoS-1
+        PUBLISH/PUBACK round-trip instead of one per ±1.
+        """
         if not self._connected or self._client is None:
             print(f"[{self._device_id}] Not connected – person delta not sent")
             return
-        payload = json.dumps({'source': self._device_id, 'delta': delta})
-        self._client.publish(self.TOPIC_PERSON_DELTA, payload, qos=1)
+        with self._delta_lock:
+            self._pending_delta += delta
+            if self._delta_timer is None:
+                self._delta_timer = threading.Timer(
+                    self.DELTA_COALESCE_SECONDS, self._flush_delta)
+                self._delta_timer.daemon = True
+                self._delta_timer.start()
+
+    def _flush_delta(self):
+        """Publish the accumulated delta (coalescing timer callback)."""
+        with self._delta_lock:
+            delta = self._pending_delta
+            self._pending_delta = 0
+            self._delta_timer = None
+            if delta == 0:
+                return
+            seq = self._delta_seq
+            self._delta_seq = (seq + 1) & 0xFFFF
+        if not self._connected or self._client is None:
+            return
+        self._client.publish(
+            self.TOPIC_PERSON_DELTA, _PACK_DELTA_SEQ(delta, seq), qos=1)
 
     # ========== QUERY ==========
 
     def get_known_state(self):
         """PI2/PI3: returns the last alarm state received from PI1."""
-        with self._state_lock:
-            return self._known_state
+        return self._known_state
 
     def is_connected(self):
         return self._connected
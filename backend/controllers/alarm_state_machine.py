@@ -87,6 +87,19 @@ class AlarmStateMachine:
 
             self._pin_buffer.append(key)
 
+    def submit_pin(self, pin):
+        """
+        Submit a complete PIN in one call.
+
+        Equivalent to handle_key() per digit followed by '#', but takes
+        the lock once and evaluates atomically - no other thread's keys
+        can interleave with the sequence. Any partially entered buffer
+        is discarded first.
+        """
+        with self._lock:
+            self._pin_buffer.clear()
+            self._process_pin(str(pin))
+
     def door_opened(self):
         """
         Called when a monitored door opens (DS1 on PI1, or DS2 event forwarded from PI2).
@@ -1,21 +1,17 @@
 """PI1 Controller - Entrance door sensors and actuators"""
 
+import asyncio
+import collections
+import queue
 import threading
 import time
 
 from mqtt_publisher import MQTTBatchPublisher
 
-from components import (
-    DoorSensor,
-    DoorLight,
-    UltrasonicSensor,
-    Buzzer,
-    MotionSensor,
-    MembraneSwitch,
-)
+from components.event_loop import get_loop
+from components.scheduler import get_scheduler
 from controllers.alarm_state_machine import AlarmStateMachine
 from controllers.alarm_mqtt_sync import AlarmMQTTSync
-from simulators import PI1Simulator
 
 
 class PI1Controller:
@@ -41,10 +37,23 @@ class PI1Controller:
 
     MOTION_LIGHT_TIMEOUT  = 10   # Rule 1: seconds light stays on after motion
     DOOR_OPEN_ALARM_DELAY = 5    # Rule 3: seconds before alarm if door stays open
+    STATUS_CACHE_TTL      = 0.5  # seconds a get_status() snapshot stays valid
+
+    # show_status layout, built once; unconfigured components print "-"
+    _STATUS_FMT = (
+        "  [DS1]   Door:      {DS1}\n"
+        "  [DL]    Light:     {DL}\n"
+        "  [DUS1]  Distance:  {DUS1}\n"
+        "  [DB]    Buzzer:    {DB}\n"
+        "  [DPIR1] Motion:    {DPIR1}\n"
+        "  [DMS]   Last key:  {DMS}\n"
+        "  [ALARM] State:     {ALARM}\n"
+        "  [HOME]  Persons:   {PERSONS}"
+    )
 
     def __init__(self, settings, mqtt_cfg=None,
                  get_person_count=None, update_person_count=None,
-                 set_person_count=None):
+                 set_person_count=None, apply_person_delta=None):
         self.settings         = settings
         self.device_info      = settings.get("device", {})
         self.sensors_settings = settings.get("sensors", {})
@@ -59,18 +68,39 @@ class PI1Controller:
         self.update_person_count = update_person_count
         self.set_person_count    = set_person_count
 
+        # Atomic delta-and-read: update the shared count and get the new
+        # value in one call, so the broadcast cannot race a concurrent
+        # update. Falls back to the legacy two-step API when only
+        # update_person_count is wired.
+        if apply_person_delta is None and update_person_count is not None:
+            def apply_person_delta(delta):
+                update_person_count(delta)
+                return self.get_person_count()
+        self.apply_person_delta = apply_person_delta
+
         # Shared MQTT publisher for sensor / actuator data
         self.publisher = MQTTBatchPublisher(_mqtt_cfg, self.device_info)
 
-        # Rule 1 state
-        self._motion_timer = None
-        self._motion_lock  = threading.Lock()
-
-        # Rule 3 state: timer for DS1 door-open alarm
-        self._door_open_timer   = None
-        self._door_timer_lock   = threading.Lock()
+        # Rule 1 + Rule 3 state. Timeouts run as one-shot entries on the
+        # shared scheduler: bursty motion reschedules with a heap push
+        # instead of spawning a fresh threading.Timer thread per event.
+        # One lock covers both timer handles — they are only touched on
+        # the rare reschedule path, never per-read.
+        self._motion_timer    = None
+        self._door_open_timer = None
+        self._timer_lock      = threading.Lock()
+
+        # Rule 3 flag: written by the door/timer paths only, read plain.
+        # CPython attribute stores are atomic, so the one-writer/
+        # many-reader pattern needs no lock around the flag itself.
         self._door_alarm_active = False
 
+        # Status snapshot cache: repeated status requests within the TTL
+        # reuse the last dict instead of re-pinging every sensor (the DUS1
+        # read alone costs a full ultrasonic echo on HW)
+        self._status_cache    = None
+        self._status_cache_ts = 0.0
+
         # Alarm sync: PI1 is the master
         self.alarm_sync = AlarmMQTTSync(
             mqtt_cfg                = _mqtt_cfg,
@@ -82,6 +112,22 @@ class PI1Controller:
             on_web_command          = self._on_web_command,
         )
 
+        # Inbound MQTT dedup: QoS-1 redeliveries or double-publishes from
+        # PI2/PI3 would otherwise replay alarm events. Keys carry a 1 s
+        # time bucket, so identical *real* events more than a second apart
+        # still pass; the window is capped by count and by age.
+        self._dedup     = collections.deque(maxlen=128)
+        self._dedup_set = set()
+        self._dedup_ttl = 5.0
+
+        # All alarm state-machine mutations are funneled through one queue
+        # consumed by a single worker thread. The state machine is reached
+        # from many threads (MQTT receive, DS1/DPIR1/DMS monitors, rule
+        # timers); serializing the events here makes transitions
+        # deterministic instead of racing on its internal lock.
+        self._alarm_q = queue.Queue()
+        self._alarm_thread = None
+
         # Rule 4: alarm state machine (PI1-owned)
         self.alarm = AlarmStateMachine(
             correct_pin    = alarm_cfg.get("pin", "1234"),
@@ -92,12 +138,61 @@ class PI1Controller:
             on_state_change= self.alarm_sync.publish_state,  # broadcast via MQTT
         )
 
+        # Event name → state-machine call for the alarm worker
+        self._alarm_dispatch = {
+            'trigger':    self.alarm.trigger_alarm,
+            'door_open':  self.alarm.door_opened,
+            'door_close': self.alarm.door_closed,
+            'key':        self.alarm.handle_key,
+            'pin':        self.alarm.submit_pin,
+        }
+
         self._init_components()
 
+        # CLI dispatch: one dict lookup per keystroke instead of walking
+        # an if/elif ladder; also makes the command set introspectable
+        self._cmd_table = {
+            's': self.show_status,
+            '1': lambda: self.components["DL"].toggle(),
+            '2': lambda: self.components["DL"].turn_on(),
+            '3': lambda: self.components["DL"].turn_off(),
+            '4': lambda: self.components["DB"].beep(0.5),
+            '5': lambda: self.components["DB"].start_alarm(),
+            '6': lambda: self.components["DB"].stop_alarm(),
+            '7': self._cmd_door_open,
+            '8': self._cmd_door_close,
+            '9': self._cmd_motion_raw,
+            'e': self._cmd_person_enter,
+            'o': self._cmd_person_exit,
+            '0': self._cmd_inject_keys,
+        }
+
+    # ========== ALARM EVENT QUEUE ==========
+
+    def _alarm_event(self, name, *args):
+        """Queue one state-machine event for the serialized worker."""
+        self._alarm_q.put((name, args))
+
+    def _alarm_worker(self):
+        while True:
+            evt = self._alarm_q.get()
+            if evt is None:
+                break
+            name, args = evt
+            try:
+                self._alarm_dispatch[name](*args)
+            except Exception as exc:
+                print(f"[ALARM] Event {name!r} failed: {exc}")
+
     # ========== INIT ==========
 
     def _init_components(self):
-        """Initialise all PI1 components."""
+        """Initialise all PI1 components.
+
+        Component classes are imported per configured sensor: a PI1
+        without e.g. a keypad never pays the keypad import cost (the
+        components package resolves classes lazily).
+        """
         s = self.sensors_settings
 
         print("=" * 50)
@@ -105,6 +200,7 @@ class PI1Controller:
         print("=" * 50)
 
         if "DS1" in s:
+            from components import DoorSensor
             self.components["DS1"] = DoorSensor(
                 'DS1', s["DS1"],
                 publisher=self.publisher,
@@ -113,6 +209,7 @@ class PI1Controller:
             self._log_init("DS1")
 
         if "DL" in s:
+            from components import DoorLight
             self.components["DL"] = DoorLight(
                 'DL', s["DL"],
                 publisher=self.publisher,
@@ -120,6 +217,7 @@ class PI1Controller:
             self._log_init("DL")
 
         if "DUS1" in s:
+            from components import UltrasonicSensor
             self.components["DUS1"] = UltrasonicSensor(
                 s["DUS1"],
                 publisher=self.publisher,
@@ -127,6 +225,7 @@ class PI1Controller:
             self._log_init("DUS1")
 
         if "DB" in s:
+            from components import Buzzer
             self.components["DB"] = Buzzer(
                 'DB', s["DB"],
                 publisher=self.publisher,
@@ -134,6 +233,7 @@ class PI1Controller:
             self._log_init("DB")
 
         if "DPIR1" in s:
+            from components import MotionSensor
             self.components["DPIR1"] = MotionSensor(
                 'DPIR1', s["DPIR1"],
                 publisher=self.publisher,
@@ -142,6 +242,7 @@ class PI1Controller:
             self._log_init("DPIR1")
 
         if "DMS" in s:
+            from components import MembraneSwitch
             self.components["DMS"] = MembraneSwitch(
                 'DMS', s["DMS"],
                 publisher=self.publisher,
@@ -151,6 +252,15 @@ class PI1Controller:
 
         print("=" * 50)
 
+        # Direct references for the hot paths (motion ticks, timers,
+        # alarm callbacks): a LOAD_ATTR instead of a dict lookup per call
+        self._ds1   = self.components.get("DS1")
+        self._dl    = self.components.get("DL")
+        self._dus1  = self.components.get("DUS1")
+        self._db    = self.components.get("DB")
+        self._dpir1 = self.components.get("DPIR1")
+        self._dms   = self.components.get("DMS")
+
     def _log_init(self, code):
         s    = self.sensors_settings[code]
         mode = "SIM" if s.get('simulate', True) else "HW"
@@ -160,41 +270,55 @@ class PI1Controller:
 
     def _start_alarm(self):
         """Called by AlarmStateMachine when entering ALARMING state."""
-        db = self.components.get("DB")
-        if db:
-            db.start_alarm()
+        if self._db is not None:
+            self._db.start_alarm()
 
     def _stop_alarm(self):
         """Called by AlarmStateMachine when leaving ALARMING state."""
-        db = self.components.get("DB")
-        if db:
-            db.stop_alarm()
+        if self._db is not None:
+            self._db.stop_alarm()
 
     # ========== ALARM MQTT CALLBACKS ==========
 
+    def _is_duplicate(self, *fields):
+        """True if the same inbound event was already seen this second."""
+        now = time.monotonic()
+        key = fields + (int(now),)
+        while self._dedup and now - self._dedup[0][0] > self._dedup_ttl:
+            self._dedup_set.discard(self._dedup.popleft()[1])
+        if key in self._dedup_set:
+            return True
+        if len(self._dedup) == self._dedup.maxlen:
+            self._dedup_set.discard(self._dedup.popleft()[1])
+        self._dedup.append((now, key))
+        self._dedup_set.add(key)
+        return False
+
     def _on_alarm_trigger_from_mqtt(self, source, reason):
         """
         Called when PI2 or PI3 published a trigger event.
         Forwards the request to the local AlarmStateMachine.
         """
+        if self._is_duplicate('trigger', source, reason):
+            return
         print(f"[ALARM] Trigger from {source}: {reason}")
-        self.alarm.trigger_alarm()
+        self._alarm_event('trigger')
 
     def _on_person_delta_from_mqtt(self, source, delta):
         """
         Called when PI2 published a person count delta via MQTT.
         Apply the delta locally and broadcast the new absolute count.
+
+        No _is_duplicate here: deltas are not idempotent, and two
+        legitimate identical deltas inside the dedup bucket (two people
+        leaving back-to-back) must both count. Redeliveries are dropped
+        in AlarmMQTTSync via the per-packet sequence number instead.
         """
-        if self.update_person_count:
-            self.update_person_count(delta)
-            count = self.get_person_count()
+        if self.apply_person_delta:
+            count = self.apply_person_delta(delta)
             self.alarm_sync.publish_person_count(count)
             print(f"[HOME] Person count from {source}: {delta:+d} -> persons: {count}")
 
-    def _publish_person_count(self):
-        """Broadcast current person count to PI2/PI3 via MQTT."""
-        self.alarm_sync.publish_person_count(self.get_person_count())
-
     def _on_door_pi2_from_mqtt(self, is_open):
         """
         Called when PI2 published a DS2 door state change.
@@ -202,10 +326,12 @@ class PI1Controller:
         Rule 3 (5 s timer) is handled locally on PI2; PI2 publishes a trigger
         when the timeout fires, which arrives here via _on_alarm_trigger_from_mqtt.
         """
+        if self._is_duplicate('door_pi2', is_open):
+            return
         if is_open:
-            self.alarm.door_opened()
+            self._alarm_event('door_open')
         else:
-            self.alarm.door_closed()
+            self._alarm_event('door_close')
 
     # ========== WEB COMMAND HANDLER ==========
 
@@ -217,14 +343,10 @@ class PI1Controller:
         pin = str(params.get('pin', ''))
         if command == 'arm':
             print(f"[WEB] Arm command received")
-            for key in pin:
-                self.alarm.handle_key(key)
-            self.alarm.handle_key('#')
+            self._alarm_event('pin', pin)
         elif command == 'disarm':
             print(f"[WEB] Disarm command received")
-            for key in pin:
-                self.alarm.handle_key(key)
-            self.alarm.handle_key('#')
+            self._alarm_event('pin', pin)
         else:
             print(f"[WEB] Unknown PI1 command: {command}")
 
@@ -236,119 +358,137 @@ class PI1Controller:
         Rule 3: start 5 s timer.
         Rule 4: notify alarm state machine.
         """
-        dl = self.components.get("DL")
-        if dl:
+        self._invalidate_status()
+        dl = self._dl
+        if dl is not None:
             dl.turn_on(reason="door opened") if is_open else dl.turn_off(reason="door closed")
 
         if is_open:
-            self.alarm.door_opened()
+            self._alarm_event('door_open')
             self._start_door_open_timer()
         else:
-            self.alarm.door_closed()
+            self._alarm_event('door_close')
             self._cancel_door_open_timer()
             if self._door_alarm_active:
                 self._stop_door_alarm()
                 print("[DS1] Door closed -> alarm stopped")
 
     def _start_door_open_timer(self):
-        with self._door_timer_lock:
+        with self._timer_lock:
             self._cancel_door_open_timer_locked()
-            self._door_open_timer = threading.Timer(
+            self._door_open_timer = get_scheduler().once(
                 self.DOOR_OPEN_ALARM_DELAY, self._door_open_timeout)
-            self._door_open_timer.daemon = True
-            self._door_open_timer.start()
 
     def _cancel_door_open_timer(self):
-        with self._door_timer_lock:
+        with self._timer_lock:
             self._cancel_door_open_timer_locked()
 
     def _cancel_door_open_timer_locked(self):
         if self._door_open_timer is not None:
-            self._door_open_timer.cancel()
+            get_scheduler().cancel(self._door_open_timer)
             self._door_open_timer = None
 
     def _door_open_timeout(self):
         """Rule 3: DS1 open > 5 s while DISARMED -> activate buzzer directly."""
-        ds = self.components.get("DS1")
-        if ds and ds.read():
+        ds = self._ds1
+        if ds is not None and ds.read():
             if self.alarm.get_state() == AlarmStateMachine.DISARMED:
                 print("[DS1] Door open >5s while DISARMED -> alarm")
                 self._start_door_alarm()
 
     def _start_door_alarm(self):
         self._door_alarm_active = True
-        db = self.components.get("DB")
-        if db:
-            db.start_alarm()
+        if self._db is not None:
+            self._db.start_alarm()
 
     def _stop_door_alarm(self):
         self._door_alarm_active = False
-        db = self.components.get("DB")
-        if db:
-            db.stop_alarm()
+        if self._db is not None:
+            self._db.stop_alarm()
 
     def _on_motion(self):
+        """DPIR1 motion hook: hand off to the shared event loop.
+
+        Runs on the PIR monitor thread; the real work includes a blocking
+        ultrasonic echo (~38 ms on HW), so it is scheduled as a coroutine
+        and the monitor thread returns immediately instead of serializing
+        a motion burst behind the echo.
+        """
+        asyncio.run_coroutine_threadsafe(self._on_motion_async(), get_loop())
+
+    async def _on_motion_async(self):
         """
-        DPIR1 motion hook.
+        DPIR1 motion body.
         Rule 1: turn DL on, reset 10 s timer.
         Rule 2a: update person count via DUS1.
         Rule 5: if count == 0 after Rule 2a -> trigger alarm.
         """
-        dl = self.components.get("DL")
-        if dl:
-            dl.turn_on(reason="motion detected")
+        self._invalidate_status()
+        if self._dl is not None:
+            self._dl.turn_on(reason="motion detected")
         self._reset_motion_timer()
 
-        # Rule 2a: update count first (must precede Rule 5 check)
-        self._update_person_count_from_ultrasonic()
+        # Read the alarm state once: it gates both Rule 2a and Rule 5.
+        # While ALARMING the count is irrelevant (Rule 5 can't re-fire),
+        # so skip the ~38 ms ultrasonic echo and its publish entirely —
+        # and PIR fires most often exactly then.
+        state = self.alarm.get_state()
+        if state == AlarmStateMachine.ALARMING:
+            return
+
+        # Rule 2a: update count first (must precede Rule 5 check).
+        # The ultrasonic read blocks, so push it onto the executor to
+        # keep the shared loop responsive.
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._update_person_count_from_ultrasonic)
 
         # Rule 5: no one home -> alarm
         if self.get_person_count() == 0:
-            if self.alarm.get_state() != AlarmStateMachine.ALARMING:
-                print("[DPIR1] Motion with no occupants -> triggering alarm")
-                self.alarm.trigger_alarm()
+            print("[DPIR1] Motion with no occupants -> triggering alarm")
+            self._alarm_event('trigger')
 
     def _reset_motion_timer(self):
-        with self._motion_lock:
+        with self._timer_lock:
             if self._motion_timer is not None:
-                self._motion_timer.cancel()
-            self._motion_timer = threading.Timer(
+                get_scheduler().cancel(self._motion_timer)
+            self._motion_timer = get_scheduler().once(
                 self.MOTION_LIGHT_TIMEOUT, self._motion_timeout)
-            self._motion_timer.daemon = True
-            self._motion_timer.start()
 
     def _motion_timeout(self):
         """Rule 1: 10 s with no new motion -> turn DL off."""
-        dl = self.components.get("DL")
-        if dl:
-            dl.turn_off(reason="motion timeout")
+        if self._dl is not None:
+            self._dl.turn_off(reason="motion timeout")
 
     def _update_person_count_from_ultrasonic(self):
         """
         Rule 2a: if DUS1 reads < ALERT_THRESHOLD_CM when DPIR1 fires,
         someone is approaching from outside -> entering (count + 1).
         """
-        if self.update_person_count is None:
+        if self.apply_person_delta is None:
             return
-        dus = self.components.get("DUS1")
+        dus = self._dus1
         if dus is None:
             return
         dist = dus.measure_and_publish()
         if dist < 0:
             return
-        if dist < UltrasonicSensor.ALERT_THRESHOLD_CM:
-            self.update_person_count(+1)
-            self._publish_person_count()
-            print(f"[HOME] Person entering (dist={dist:.1f} cm) -> persons: {self.get_person_count()}")
+        if dist < dus.ALERT_THRESHOLD_CM:
+            count = self.apply_person_delta(+1)
+            self.alarm_sync.publish_person_count(count)
+            print(f"[HOME] Person entering (dist={dist:.1f} cm) -> persons: {count}")
 
     def _on_key(self, key):
         """Rule 4: forward key press to the alarm state machine."""
-        self.alarm.handle_key(key)
+        self._invalidate_status()
+        self._alarm_event('key', key)
 
     # ========== LIFECYCLE ==========
 
     def start(self):
         self.running = True
+        self._alarm_thread = threading.Thread(target=self._alarm_worker,
+                                              daemon=True)
+        self._alarm_thread.start()
         self.publisher.start()
         self.alarm_sync.start()
 
@@ -360,20 +500,24 @@ class PI1Controller:
         if "DUS1" in self.components:
             self.components["DUS1"].start_monitoring(interval=2.0)
 
+        from simulators import PI1Simulator   # only needed once running
         self.simulator = PI1Simulator(self.components)
         self.simulator.start()
 
     def stop(self):
         self.running = False
 
-        with self._motion_lock:
+        if self._alarm_thread is not None:
+            self._alarm_q.put(None)   # sentinel: drain queued events, then exit
+            self._alarm_thread.join(timeout=1)
+            self._alarm_thread = None
+
+        with self._timer_lock:
             if self._motion_timer:
-                self._motion_timer.cancel()
+                get_scheduler().cancel(self._motion_timer)
                 self._motion_timer = None
-
-        with self._door_timer_lock:
             if self._door_open_timer:
-                self._door_open_timer.cancel()
+                get_scheduler().cancel(self._door_open_timer)
                 self._door_open_timer = None
 
         if self._door_alarm_active:
@@ -382,12 +526,15 @@ class PI1Controller:
         if self.simulator:
             self.simulator.stop()
 
-        self.alarm_sync.stop()
-        self.publisher.stop()
-
+        # Stop sensors first and flush their batch buffers while the
+        # publisher is still alive, so the tail of each batch goes out
+        # instead of being dropped with the publisher process
         for comp in self.components.values():
             if hasattr(comp, 'stop'):
                 comp.stop()
+            comp.flush()
+        self.alarm_sync.stop()
+        self.publisher.stop()
 
     def cleanup(self):
         self.stop()
@@ -397,6 +544,10 @@ class PI1Controller:
     # ========== STATUS ==========
 
     def get_status(self):
+        now = time.monotonic()
+        if (self._status_cache is not None
+                and now - self._status_cache_ts < self.STATUS_CACHE_TTL):
+            return self._status_cache
         status = {}
         if "DS1"   in self.components:
             status["DS1"]  = "OPEN" if self.components["DS1"].read() else "CLOSED"
@@ -416,21 +567,23 @@ class PI1Controller:
             status["DMS"]  = self.components["DMS"].last_key or "-"
         status["ALARM"]   = self.alarm.get_state()
         status["PERSONS"] = self.get_person_count()
+        self._status_cache = status
+        self._status_cache_ts = now
         return status
 
+    def _invalidate_status(self):
+        """Drop the cached snapshot after an asynchronous sensor event."""
+        self._status_cache_ts = 0.0
+
     def show_status(self):
         print("\n" + "=" * 40)
         print("PI1 STATUS")
         print("=" * 40)
         s = self.get_status()
-        if "DS1"   in s: print(f"  [DS1]   Door:      {s['DS1']}")
-        if "DL"    in s: print(f"  [DL]    Light:     {s['DL']}")
-        if "DUS1"  in s: print(f"  [DUS1]  Distance:  {s['DUS1']}")
-        if "DB"    in s: print(f"  [DB]    Buzzer:    {s['DB']}")
-        if "DPIR1" in s: print(f"  [DPIR1] Motion:    {s['DPIR1']}")
-        if "DMS"   in s: print(f"  [DMS]   Last key:  {s['DMS']}")
-        print(f"  [ALARM] State:     {s['ALARM']}")
-        print(f"  [HOME]  Persons:   {s['PERSONS']}")
+        print(self._STATUS_FMT.format_map(
+            {key: s.get(key, "-")
+             for key in ("DS1", "DL", "DUS1", "DB", "DPIR1", "DMS",
+                         "ALARM", "PERSONS")}))
         print("=" * 40)
 
     # ========== COMMANDS ==========
@@ -447,59 +600,49 @@ class PI1Controller:
           o          - simulate person exiting (-1 count)
           0          - inject DMS keypad keys
         """
-        if cmd == 's':
-            self.show_status()
-
-        # --- Actuators ---
-        elif cmd == '1':
-            self.components["DL"].toggle()
-        elif cmd == '2':
-            self.components["DL"].turn_on()
-        elif cmd == '3':
-            self.components["DL"].turn_off()
-        elif cmd == '4':
-            self.components["DB"].beep(0.5)
-        elif cmd == '5':
-            self.components["DB"].start_alarm()
-        elif cmd == '6':
-            self.components["DB"].stop_alarm()
-
-        # --- Simulation ---
-        elif cmd == '7':
-            self.components["DS1"].set_state(True)
-            print("[SIM] DS1 -> OPEN")
-        elif cmd == '8':
-            self.components["DS1"].set_state(False)
-            print("[SIM] DS1 -> CLOSED")
-        elif cmd == '9':
-            self.components["DPIR1"].set_motion(True)
-            print("[SIM] DPIR1 Motion ON (raw, no DUS1 change)")
-            time.sleep(1)
-            self.components["DPIR1"].set_motion(False)
-        elif cmd == 'e':
-            if "DUS1" in self.components:
-                self.components["DUS1"].set_distance(15.0)
-            self.components["DPIR1"].set_motion(True)
-            print("[SIM] Person entering – DUS1=15 cm, DPIR1 ON")
-            time.sleep(1)
-            self.components["DPIR1"].set_motion(False)
-            if "DUS1" in self.components:
-                self.components["DUS1"].set_distance(200.0)
-        elif cmd == 'o':
-            if self.update_person_count:
-                self.update_person_count(-1)
-                self._publish_person_count()
-                print(f"[SIM] Person exited -> persons: {self.get_person_count()}")
-            else:
-                print("[SIM] update_person_count not wired (run from main.py)")
-        elif cmd == '0':
-            keys = input("Keys (e.g. '1234#' to arm/disarm): ").strip()
-            for k in keys:
-                self.components["DMS"].set_key(k)
-            if keys:
-                print(f"[SIM] Injected keys: {' '.join(keys)}")
-
-        else:
+        fn = self._cmd_table.get(cmd)
+        if fn is None:
             return None
-
+        fn()
         return True
+
+    # --- Simulation commands (multi-step, referenced from the table) ---
+
+    def _cmd_door_open(self):
+        self.components["DS1"].set_state(True)
+        print("[SIM] DS1 -> OPEN")
+
+    def _cmd_door_close(self):
+        self.components["DS1"].set_state(False)
+        print("[SIM] DS1 -> CLOSED")
+
+    def _cmd_motion_raw(self):
+        self.components["DPIR1"].set_motion(True)
+        print("[SIM] DPIR1 Motion ON (raw, no DUS1 change)")
+        time.sleep(1)
+        self.components["DPIR1"].set_motion(False)
+
+    def _cmd_person_enter(self):
+        if "DUS1" in self.components:
+            self.components["DUS1"].set_distance(15.0)
+        self.components["DPIR1"].set_motion(True)
+        print("[SIM] Person entering – DUS1=15 cm, DPIR1 ON")
+        time.sleep(1)
+        self.components["DPIR1"].set_motion(False)
+        if "DUS1" in self.components:
+            self.components["DUS1"].set_distance(200.0)
+
+    def _cmd_person_exit(self):
+        if self.apply_person_delta:
+            count = self.apply_person_delta(-1)
+            self.alarm_sync.publish_person_count(count)
+            print(f"[SIM] Person exited -> persons: {count}")
+        else:
+            print("[SIM] update_person_count not wired (run from main.py)")
+
+    def _cmd_inject_keys(self):
+        keys = input("Keys (e.g. '1234#' to arm/disarm): ").strip()
+        for k in keys:
+            self.components["DMS"].set_key(k)
+        if keys:
+            print(f"[SIM] Injected keys: {' '.join(keys)}")
@@ -1,5 +1,8 @@
 """PI2 Controller - Kitchen / Upstairs sensors and actuators"""
 
+import asyncio
+import collections
+import sys
 import threading
 import time
 
@@ -14,6 +17,8 @@ from components import (
     FourDigitDisplay,
     GyroscopeSensor,
 )
+from components.event_loop import get_loop
+from components.scheduler import get_scheduler
 from controllers.alarm_mqtt_sync import AlarmMQTTSync
 from simulators import PI2Simulator
 
@@ -39,8 +44,45 @@ class PI2Controller:
     - Rule 8  : Kitchen timer on 4SD, BTN adds seconds.
     """
 
+    # Fixed attribute set: slots turn every hot-path attribute access
+    # (sensor callbacks, timer ticks, status) into a fixed-offset load
+    # instead of an instance-dict probe, and drop the per-instance dict
+    __slots__ = (
+        'settings', 'device_info', 'sensors_settings', 'components',
+        'running', 'simulator',
+        'get_person_count', 'update_person_count', 'set_person_count',
+        '_rule2a_enabled', 'publisher',
+        '_door_open_timer', '_door_is_open',
+        '_last_door_state', '_last_door_ts',
+        '_timer_end', '_timer_future', '_timer_lock', '_timer_running',
+        '_dht3_future', '_dus_last', '_log_q', '_log_future',
+        'alarm_sync', '_known_alarm_state', '_is_alarming', '_is_disarmed',
+        '_cmd_table',
+        '_ds2', '_dus2', '_dpir2', '_dht3', '_btn', '_sd4', '_gsg',
+    )
+
+    # Full status frame as one template: show_status renders it with
+    # format_map and hands it to stdout in a single write instead of a
+    # print (lock + syscall) per line
+    _STATUS_FMT = (
+        "\n" + "=" * 40 + "\n"
+        "PI2 STATUS\n"
+        + "=" * 40 + "\n"
+        "  [DS2]   Door:      {DS2}\n"
+        "  [DUS2]  Distance:  {DUS2}\n"
+        "  [DPIR2] Motion:    {DPIR2}\n"
+        "  [BTN]   Button:    {BTN}\n"
+        "  [4SD]   Display:   {4SD}\n"
+        "  [GSG]   Accel:     {GSG}\n"
+        "  [ALARM] State:     {ALARM}\n"
+        "  [HOME]  Persons:   {PERSONS}\n"
+        + "=" * 40 + "\n"
+    )
+
     DOOR_OPEN_ALARM_DELAY = 5   # Rule 3: seconds before trigger if DS2 stays open
     DHT_READ_INTERVAL     = 10  # Rule 7: how often DHT3 is read and published (seconds)
+    DUS_READING_MAX_AGE   = 3.0 # Rule 2a: max age of a cached DUS2 reading (seconds)
+    DOOR_DEBOUNCE_SECONDS = 0.1 # DS2: window for dropping repeated same-state edges
 
     def __init__(self, settings, mqtt_cfg=None,
                  get_person_count=None, update_person_count=None,
@@ -58,24 +100,56 @@ class PI2Controller:
         self.get_person_count    = get_person_count    or (lambda: 0)
         self.update_person_count = update_person_count
         self.set_person_count    = set_person_count
+        # Rule 2a only applies when the count callback is wired (i.e. run
+        # from main.py); decided once so the motion path can skip the
+        # whole update call when standalone
+        self._rule2a_enabled = update_person_count is not None
 
         # Shared MQTT publisher for sensor / actuator data
         self.publisher = MQTTBatchPublisher(_mqtt_cfg, self.device_info)
 
-        # Rule 3 state: local 5 s timer for DS2 door-open alarm
+        # Rule 3 state: local 5 s timer for DS2 door-open alarm. Runs as
+        # a one-shot entry on the shared scheduler, so bursty door
+        # activity reschedules with a heap push instead of spawning a
+        # fresh threading.Timer thread per open event. The handle and
+        # the open flag have one writer (the DS2 monitor thread) and
+        # CPython attribute stores are atomic, so no lock is needed;
+        # a stale timeout firing is harmless — it re-checks the flag.
         self._door_open_timer = None
-        self._door_timer_lock = threading.Lock()
         self._door_is_open    = False
-
-        # Rule 8: kitchen timer state
-        self._timer_remaining  = 0       # seconds remaining
-        self._timer_thread     = None
-        self._timer_lock       = threading.Lock()
-        self._timer_running    = False
-        self._timer_stop_event = threading.Event()
-
-        # Rule 7: background thread that periodically publishes DHT3 for PI3 LCD
-        self._dht3_thread = None
+        # DS2 debounce: a chattering reed switch repeats the same edge
+        # many times in a few ms; only the first in each window is
+        # forwarded (publish + timer management)
+        self._last_door_state = None
+        self._last_door_ts    = 0.0
+
+        # Rule 8: kitchen timer state. The countdown is an absolute
+        # monotonic deadline rather than a decremented counter, so the
+        # loop needs no per-tick lock or Event wait. The countdown, the
+        # DHT3 publisher and the log flusher all run as coroutines on
+        # the shared event loop rather than dedicated daemon threads:
+        # three mostly-idle threads' worth of stacks and context
+        # switches collapse into one loop thread.
+        self._timer_end     = 0.0
+        self._timer_future  = None
+        self._timer_lock    = threading.Lock()   # guards _timer_end adjustments
+        self._timer_running = False
+
+        # Rule 7: periodic DHT3 publish task for the PI3 LCD
+        self._dht3_future = None
+
+        # Rule 2a: latest (distance_cm, monotonic_ts) from the DUS2
+        # monitor thread; the motion hook reads this cache instead of
+        # blocking on an on-demand echo
+        self._dus_last = (float('inf'), 0.0)
+
+        # Sensor callbacks log through a ring buffer drained by one
+        # daemon thread: the callback pays a lock-free deque append
+        # instead of the stdout lock plus a write syscall, so an event
+        # storm cannot serialize the sensor threads on stdio. CLI
+        # feedback still prints directly — it should echo immediately.
+        self._log_q      = collections.deque(maxlen=4096)
+        self._log_future = None
 
         # Alarm sync: PI2 is a slave
         self.alarm_sync = AlarmMQTTSync(
@@ -87,9 +161,27 @@ class PI2Controller:
             on_web_command            = self._on_web_command,
         )
         self._known_alarm_state = alarm_cfg.get('initial_state', 'DISARMED')
+        # Precomputed state flags: the motion/gyro/door hot paths read a
+        # bool instead of re-comparing the state string per event
+        self._is_alarming = self._known_alarm_state == 'ALARMING'
+        self._is_disarmed = self._known_alarm_state == 'DISARMED'
 
         self._init_components()
 
+        # CLI dispatch: one dict lookup per keystroke instead of walking
+        # an if/elif ladder
+        self._cmd_table = {
+            's': self.show_status,
+            '7': self._cmd_door_open,
+            '8': self._cmd_door_close,
+            'e': self._cmd_person_enter,
+            'o': self._cmd_person_exit,
+            '9': self._cmd_motion_only,
+            'g': self._cmd_gyro_move,
+            'p': self._cmd_button_press,
+            'd': self._cmd_set_distance,
+        }
+
     # ========== INIT ==========
 
     def _init_components(self):
@@ -100,79 +192,88 @@ class PI2Controller:
         print("Initializing PI2 Components...")
         print("=" * 50)
 
-        if "DS2" in s:
-            self.components["DS2"] = DoorSensor(
-                'DS2', s["DS2"],
-                publisher=self.publisher,
-                on_change=self._on_door_change,
-            )
-            self._log_init("DS2")
-
-        if "DUS2" in s:
-            self.components["DUS2"] = UltrasonicSensor(
-                s["DUS2"],
-                publisher=self.publisher,
-                code='DUS2',
-            )
-            self._log_init("DUS2")
-
-        if "DPIR2" in s:
-            self.components["DPIR2"] = MotionSensor(
-                'DPIR2', s["DPIR2"],
-                publisher=self.publisher,
-                on_motion=self._on_motion,     # Rule 5
-            )
-            self._log_init("DPIR2")
-
-        if "DHT3" in s:
-            self.components["DHT3"] = DHTSensor(
-                'DHT3', s["DHT3"],
-                publisher=self.publisher,
-            )
-            self._log_init("DHT3")
-
-        if "BTN" in s:
-            self.components["BTN"] = Button(
-                'BTN', s["BTN"],
-                publisher=self.publisher,
-                on_press=self._on_button_press,   # Rule 8b
-            )
-            self._log_init("BTN")
-
-        if "4SD" in s:
-            self.components["4SD"] = FourDigitDisplay(
-                '4SD', s["4SD"],
-                publisher=self.publisher,
-            )
-            self._log_init("4SD")
-
-        if "GSG" in s:
-            self.components["GSG"] = GyroscopeSensor(
-                'GSG', s["GSG"],
-                publisher=self.publisher,
-                on_displacement=self._on_displacement,   # Rule 6
-            )
-            self._log_init("GSG")
+        pub = self.publisher
+        # Driver table instead of seven near-identical if-blocks; each
+        # entry builds its component from that sensor's settings (DUS2's
+        # constructor takes the code as a keyword, hence its own lambda)
+        specs = (
+            ("DS2",   lambda cfg: DoorSensor(
+                'DS2', cfg, publisher=pub,
+                on_change=self._on_door_change)),
+            ("DUS2",  lambda cfg: UltrasonicSensor(
+                cfg, publisher=pub,
+                on_alert=self._on_dus2_reading,   # Rule 2a reading cache
+                code='DUS2')),
+            ("DPIR2", lambda cfg: MotionSensor(
+                'DPIR2', cfg, publisher=pub,
+                on_motion=self._on_motion)),      # Rule 5
+            ("DHT3",  lambda cfg: DHTSensor('DHT3', cfg, publisher=pub)),
+            ("BTN",   lambda cfg: Button(
+                'BTN', cfg, publisher=pub,
+                on_press=self._on_button_press)), # Rule 8b
+            ("4SD",   lambda cfg: FourDigitDisplay('4SD', cfg, publisher=pub)),
+            ("GSG",   lambda cfg: GyroscopeSensor(
+                'GSG', cfg, publisher=pub,
+                on_displacement=self._on_displacement)),   # Rule 6
+        )
+        for code, make in specs:
+            if code in s:
+                self.components[code] = make(s[code])
+                self._log_init(code)
 
         print("=" * 50)
 
+        # Direct references for the hot paths (motion hook, kitchen
+        # timer ticks, status): a LOAD_ATTR instead of a dict lookup
+        # per call. 4SD gets _sd4 since an identifier can't start
+        # with a digit.
+        self._ds2   = self.components.get("DS2")
+        self._dus2  = self.components.get("DUS2")
+        self._dpir2 = self.components.get("DPIR2")
+        self._dht3  = self.components.get("DHT3")
+        self._btn   = self.components.get("BTN")
+        self._sd4   = self.components.get("4SD")
+        self._gsg   = self.components.get("GSG")
+
     def _log_init(self, code):
         s    = self.sensors_settings[code]
         mode = "SIM" if s.get('simulate', True) else "HW"
         print(f"  [{code}] {s.get('name', code)} ({mode})")
 
+    # ========== EVENT LOG ==========
+
+    def _log(self, msg):
+        """Queue a console line; the flusher thread writes it out."""
+        self._log_q.append(msg)
+
+    async def _log_flush_task(self):
+        """Drain queued lines into one stdout write per flush tick."""
+        q     = self._log_q
+        write = sys.stdout.write
+        flush = sys.stdout.flush
+        while self.running or q:
+            if q:
+                msgs = []
+                while q:
+                    msgs.append(q.popleft())
+                write('\n'.join(msgs) + '\n')
+                flush()
+            await asyncio.sleep(0.05)
+
     # ========== ALARM SYNC CALLBACK ==========
 
     def _on_alarm_state_received(self, state):
         """Called by AlarmMQTTSync when PI1 broadcasts a new alarm state."""
         self._known_alarm_state = state
-        print(f"[PI2] Alarm state updated -> {state}")
+        self._is_alarming = state == 'ALARMING'
+        self._is_disarmed = state == 'DISARMED'
+        self._log(f"[PI2] Alarm state updated -> {state}")
 
     def _on_person_count_received(self, count):
         """Called by AlarmMQTTSync when PI1 broadcasts absolute person count."""
         if self.set_person_count:
             self.set_person_count(count)
-        print(f"[PI2] Person count updated -> {count}")
+        self._log(f"[PI2] Person count updated -> {count}")
 
     # ========== WEB COMMAND HANDLER ==========
 
@@ -196,72 +297,70 @@ class PI2Controller:
 
     def _start_kitchen_timer(self, total_seconds):
         """Start or restart the kitchen countdown timer on 4SD."""
-        # Stop any existing timer and wait for its thread to finish
-        with self._timer_lock:
-            self._timer_running = False
-        self._timer_stop_event.set()
-        if self._timer_thread and self._timer_thread.is_alive():
-            self._timer_thread.join(timeout=2)
+        # Cancel any existing countdown task
+        self._timer_running = False
+        if self._timer_future is not None:
+            self._timer_future.cancel()
         # Start new timer
-        self._timer_stop_event.clear()
+        total = max(1, total_seconds)
         with self._timer_lock:
-            self._timer_remaining = max(1, total_seconds)
-            self._timer_running = True
-        display = self.components.get("4SD")
+            self._timer_end = time.monotonic() + total
+        self._timer_running = True
+        display = self._sd4
         if display:
             display.stop_blink()
-            display.show_time(self._timer_remaining)
-        self._timer_thread = threading.Thread(
-            target=self._timer_loop, daemon=True)
-        self._timer_thread.start()
+            display.show_time(total)
+        self._timer_future = asyncio.run_coroutine_threadsafe(
+            self._timer_task(), get_loop())
         print(f"[TIMER] Started: {total_seconds}s")
 
     def _add_timer_seconds(self, seconds):
         """Add seconds to the running kitchen timer."""
         with self._timer_lock:
             if self._timer_running:
-                self._timer_remaining += seconds
-                print(f"[TIMER] Added {seconds}s -> {self._timer_remaining}s remaining")
+                self._timer_end += seconds
+                remaining = int(self._timer_end - time.monotonic())
+                print(f"[TIMER] Added {seconds}s -> {remaining}s remaining")
             else:
                 print("[TIMER] Not running, cannot add time")
 
     def _stop_kitchen_timer(self):
         """Stop the kitchen timer and clear the display."""
-        with self._timer_lock:
-            was_running = self._timer_running
-            self._timer_running = False
-        self._timer_stop_event.set()
-        if self._timer_thread and self._timer_thread.is_alive():
-            self._timer_thread.join(timeout=2)
-            self._timer_thread = None
-        display = self.components.get("4SD")
+        was_running = self._timer_running
+        self._timer_running = False
+        if self._timer_future is not None:
+            self._timer_future.cancel()
+            self._timer_future = None
+        display = self._sd4
         if display:
             display.stop_blink()
             display.clear()
         if was_running:
             print("[TIMER] Stopped")
 
-    def _timer_loop(self):
-        """Background thread: counts down every second, updates 4SD."""
-        display = self.components.get("4SD")
-        while not self._timer_stop_event.is_set():
-            # Wait 1 second, but wake immediately if stop is signaled
-            if self._timer_stop_event.wait(timeout=1.0):
-                return
+    async def _timer_task(self):
+        """Countdown coroutine: ticks down to the deadline, updates 4SD.
+
+        Sleeps to each whole-second boundary of the countdown and checks
+        a plain bool — restarting or stopping the timer cancels the task,
+        and the lock is only taken to read the (adjustable) deadline.
+        """
+        display   = self._sd4
+        monotonic = time.monotonic
+        while self._timer_running:
             with self._timer_lock:
-                if not self._timer_running:
-                    return
-                self._timer_remaining -= 1
-                remaining = self._timer_remaining
+                remaining = self._timer_end - monotonic()
             if remaining <= 0:
-                with self._timer_lock:
-                    self._timer_running = False
+                self._timer_running = False
                 if display:
                     display.start_blink("0000")
                 print("[TIMER] Time's up!")
                 return
+            secs = int(remaining)
             if display:
-                display.show_time(remaining)
+                display.show_time(secs)
+            frac = remaining - secs
+            await asyncio.sleep(frac if frac > 0.001 else 1.0)
 
     # ========== SENSOR HOOKS ==========
 
@@ -272,7 +371,13 @@ class PI2Controller:
                 -> publish alarm trigger to PI1.
         Rule 4: forward open/close event to PI1 for alarm grace-period management.
         """
-        print(f"[DS2] Door {'OPEN' if is_open else 'CLOSED'}")
+        now = time.monotonic()
+        if (is_open == self._last_door_state
+                and now - self._last_door_ts < self.DOOR_DEBOUNCE_SECONDS):
+            return
+        self._last_door_state = is_open
+        self._last_door_ts    = now
+        self._log(f"[DS2] Door {'OPEN' if is_open else 'CLOSED'}")
         self._door_is_open = is_open
         self.alarm_sync.publish_door_event(is_open)   # Rule 4: grace period
 
@@ -282,26 +387,19 @@ class PI2Controller:
             self._cancel_door_open_timer()
 
     def _start_door_open_timer(self):
-        with self._door_timer_lock:
-            self._cancel_door_open_timer_locked()
-            self._door_open_timer = threading.Timer(
-                self.DOOR_OPEN_ALARM_DELAY, self._door_open_timeout)
-            self._door_open_timer.daemon = True
-            self._door_open_timer.start()
+        self._cancel_door_open_timer()
+        self._door_open_timer = get_scheduler().once(
+            self.DOOR_OPEN_ALARM_DELAY, self._door_open_timeout)
 
     def _cancel_door_open_timer(self):
-        with self._door_timer_lock:
-            self._cancel_door_open_timer_locked()
-
-    def _cancel_door_open_timer_locked(self):
         if self._door_open_timer is not None:
-            self._door_open_timer.cancel()
+            get_scheduler().cancel(self._door_open_timer)
             self._door_open_timer = None
 
     def _door_open_timeout(self):
         """Rule 3: DS2 open > 5 s while DISARMED -> publish alarm trigger to PI1."""
-        if self._door_is_open and self._known_alarm_state == 'DISARMED':
-            print("[DS2] Door open >5s while DISARMED -> triggering alarm")
+        if self._door_is_open and self._is_disarmed:
+            self._log("[DS2] Door open >5s while DISARMED -> triggering alarm")
             self.alarm_sync.publish_trigger(reason='door_open_5s_DS2')
 
     def _on_motion(self):
@@ -310,12 +408,13 @@ class PI2Controller:
         Rule 2a: update person count via DUS2 (must precede Rule 5 check).
         Rule 5: if person_count == 0 -> publish alarm trigger to PI1.
         """
-        print("[DPIR2] Motion detected")
+        self._log("[DPIR2] Motion detected")
         # --- Rule 2a: update count first ---
-        self._update_person_count_from_ultrasonic()
+        if self._rule2a_enabled:
+            self._update_person_count_from_ultrasonic()
         # --- Rule 5 ---
-        if self.get_person_count() == 0 and self._known_alarm_state != 'ALARMING':
-            print("[DPIR2] Motion with no occupants -> triggering alarm")
+        if self.get_person_count() == 0 and not self._is_alarming:
+            self._log("[DPIR2] Motion with no occupants -> triggering alarm")
             self.alarm_sync.publish_trigger(reason='motion_no_occupants')
 
     def _on_button_press(self):
@@ -323,7 +422,7 @@ class PI2Controller:
         BTN kitchen button press.
         Rule 8b: adds 30 seconds to the running kitchen timer.
         """
-        print("[BTN] Button pressed")
+        self._log("[BTN] Button pressed")
         self._add_timer_seconds(30)
 
     def _on_displacement(self, delta, accel):
@@ -331,67 +430,95 @@ class PI2Controller:
         GSG significant displacement.
         Rule 6: significant movement -> publish alarm trigger to PI1.
         """
-        print(f"[GSG] Significant displacement detected (delta={delta:.3f} g)")
-        if self._known_alarm_state != 'ALARMING':
-            self.alarm_sync.publish_trigger(reason=f'gyroscope_displacement delta={delta:.3f}')
+        self._log(f"[GSG] Significant displacement detected (delta={delta:.3f} g)")
+        if not self._is_alarming:
+            self.alarm_sync.publish_trigger(reason='gyroscope_displacement',
+                                            detail=delta)
 
-    def _dht3_loop(self):
+    async def _dht3_task(self):
         """
         Rule 7: periodically read DHT3 and publish to MQTT so PI3 can display it on LCD.
-        Runs as a background daemon thread while the controller is active.
+        Runs as a coroutine on the shared loop while the controller is active.
         Publishes silently (no console output) to avoid cluttering the PI2 terminal.
         """
+        # Hoist the component and interval out of the loop: both are set
+        # once at init and never reassigned
+        dht = self._dht3
+        if dht is None:
+            return
+        interval  = self.DHT_READ_INTERVAL
+        monotonic = time.monotonic
+        loop      = asyncio.get_running_loop()
+        # Deadline-based cadence (same as the DUS monitor): sleeping a
+        # fixed interval after each read would stretch the period by the
+        # sensor read time and drift over a session
+        next_t = monotonic()
         while self.running:
-            dht = self.components.get("DHT3")
-            if dht:
-                dht.read_and_publish(silent=True)
-            time.sleep(self.DHT_READ_INTERVAL)
+            # A hardware DHT read can take hundreds of ms; keep it off
+            # the shared loop so other tasks aren't starved
+            await loop.run_in_executor(
+                None, lambda: dht.read_and_publish(silent=True))
+            next_t += interval
+            delay = next_t - monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            else:
+                next_t = monotonic()   # fell behind; resync
+
+    def _on_dus2_reading(self, distance, is_alert):
+        """DUS2 monitor callback: cache the latest reading for _on_motion."""
+        self._dus_last = (distance, time.monotonic())
 
     def _update_person_count_from_ultrasonic(self):
         """
         Rule 2a: if DUS2 reads < threshold when DPIR2 fires -> entering (+1).
-        Called from _on_motion in logic-rules phase.
+        On hardware this uses the reading cached by the DUS2 monitor
+        thread, so the DPIR2 callback never blocks on a ~30 ms echo; in
+        simulation the read is instant (and must see a distance injected
+        a moment ago), so it stays synchronous.
         """
-        if self.update_person_count is None:
-            return
-        dus = self.components.get("DUS2")
+        dus = self._dus2
         if dus is None:
             return
-        dist = dus.measure_and_publish()
-        if dist < 0:
-            return
+        if dus.simulate:
+            dist = dus.measure_and_publish()
+            if dist < 0:
+                return
+        else:
+            dist, ts = self._dus_last
+            if time.monotonic() - ts > self.DUS_READING_MAX_AGE:
+                return
         if dist < UltrasonicSensor.ALERT_THRESHOLD_CM:
             self.update_person_count(+1)
             self.alarm_sync.publish_person_delta(+1)
-            print(f"[HOME] Person entering (dist={dist:.1f} cm) -> persons: {self.get_person_count()}")
+            self._log(f"[HOME] Person entering (dist={dist:.1f} cm) -> persons: {self.get_person_count()}")
 
     # ========== LIFECYCLE ==========
 
     def start(self):
         self.running = True
+        self._log_future = asyncio.run_coroutine_threadsafe(
+            self._log_flush_task(), get_loop())
         self.publisher.start()
         self.alarm_sync.start()
 
-        if "DS2"   in self.components:
-            self.components["DS2"].start_monitoring()
-        if "DPIR2" in self.components:
-            self.components["DPIR2"].start_monitoring()
-        if "BTN"   in self.components:
-            self.components["BTN"].start_monitoring()
-        if "GSG"   in self.components:
-            self.components["GSG"].start_monitoring()
+        if self._ds2   is not None:
+            self._ds2.start_monitoring()
+        if self._dpir2 is not None:
+            self._dpir2.start_monitoring()
+        if self._btn   is not None:
+            self._btn.start_monitoring()
+        if self._gsg   is not None:
+            self._gsg.start_monitoring()
 
         # DUS2: continuous monitoring (publishes distance every 2 s)
-        if "DUS2" in self.components:
-            self.components["DUS2"].start_monitoring(interval=2.0)
+        if self._dus2 is not None:
+            self._dus2.start_monitoring(interval=2.0)
 
-        # Rule 7: start DHT3 publish thread so PI3 LCD receives kitchen temperature
-        if "DHT3" in self.components:
-            self._dht3_thread = threading.Thread(
-                target=self._dht3_loop,
-                daemon=True,
-            )
-            self._dht3_thread.start()
+        # Rule 7: start DHT3 publish task so PI3 LCD receives kitchen temperature
+        if self._dht3 is not None:
+            self._dht3_future = asyncio.run_coroutine_threadsafe(
+                self._dht3_task(), get_loop())
 
         self.simulator = PI2Simulator(self.components)
         self.simulator.start()
@@ -399,15 +526,27 @@ class PI2Controller:
     def stop(self):
         self.running = False
         self._stop_kitchen_timer()
-        with self._door_timer_lock:
-            self._cancel_door_open_timer_locked()
+        self._cancel_door_open_timer()
         if self.simulator:
             self.simulator.stop()
-        self.alarm_sync.stop()
-        self.publisher.stop()
+        # Stop sensors first and flush their batch buffers while the
+        # publisher is still alive, so the tail of each batch goes out
+        # instead of being dropped with the publisher process
         for comp in self.components.values():
             if hasattr(comp, 'stop'):
                 comp.stop()
+            comp.flush()
+        self.alarm_sync.stop()
+        self.publisher.stop()
+        if self._dht3_future is not None:
+            self._dht3_future.cancel()
+            self._dht3_future = None
+        if self._log_future is not None:
+            try:
+                self._log_future.result(timeout=1)   # drains remaining lines
+            except Exception:
+                pass
+            self._log_future = None
 
     def cleanup(self):
         self.stop()
@@ -418,19 +557,19 @@ class PI2Controller:
 
     def get_status(self):
         status = {}
-        if "DS2"   in self.components:
-            status["DS2"]  = "OPEN" if self.components["DS2"].read() else "CLOSED"
-        if "DUS2"  in self.components:
-            dist = self.components["DUS2"].measure_distance()
+        if self._ds2   is not None:
+            status["DS2"]  = "OPEN" if self._ds2.read() else "CLOSED"
+        if self._dus2  is not None:
+            dist = self._dus2.measure_distance()
             status["DUS2"] = f"{dist:.1f} cm"
-        if "DPIR2" in self.components:
-            status["DPIR2"] = "DETECTED" if self.components["DPIR2"].read() else "CLEAR"
-        if "BTN"   in self.components:
+        if self._dpir2 is not None:
+            status["DPIR2"] = "DETECTED" if self._dpir2.read() else "CLEAR"
+        if self._btn   is not None:
             status["BTN"]  = "monitoring"
-        if "4SD"   in self.components:
-            status["4SD"]  = self.components["4SD"].get_display_text()
-        if "GSG"   in self.components:
-            data = self.components["GSG"].read()
+        if self._sd4   is not None:
+            status["4SD"]  = self._sd4.get_display_text()
+        if self._gsg   is not None:
+            data = self._gsg.read()
             accel = data.get('accel', {})
             status["GSG"] = (f"ax={accel.get('x', 0):.2f} "
                              f"ay={accel.get('y', 0):.2f} "
@@ -440,19 +579,11 @@ class PI2Controller:
         return status
 
     def show_status(self):
-        print("\n" + "=" * 40)
-        print("PI2 STATUS")
-        print("=" * 40)
         s = self.get_status()
-        if "DS2"   in s: print(f"  [DS2]   Door:      {s['DS2']}")
-        if "DUS2"  in s: print(f"  [DUS2]  Distance:  {s['DUS2']}")
-        if "DPIR2" in s: print(f"  [DPIR2] Motion:    {s['DPIR2']}")
-        if "BTN"   in s: print(f"  [BTN]   Button:    {s['BTN']}")
-        if "4SD"   in s: print(f"  [4SD]   Display:   {s['4SD']}")
-        if "GSG"   in s: print(f"  [GSG]   Accel:     {s['GSG']}")
-        print(f"  [ALARM] State:     {s['ALARM']}")
-        print(f"  [HOME]  Persons:   {s['PERSONS']}")
-        print("=" * 40)
+        sys.stdout.write(self._STATUS_FMT.format_map(
+            {key: s.get(key, "-")
+             for key in ("DS2", "DUS2", "DPIR2", "BTN", "4SD", "GSG",
+                         "ALARM", "PERSONS")}))
 
     # ========== COMMANDS ==========
 
@@ -468,68 +599,67 @@ class PI2Controller:
           p     - simulate button press (BTN)
           d     - DUS2 custom distance reading
         """
-        if cmd == 's':
-            self.show_status()
-
-        # --- Door simulation ---
-        elif cmd == '7':
-            self.components["DS2"].set_state(True)
-            print("[SIM] DS2 -> OPEN")
-        elif cmd == '8':
-            self.components["DS2"].set_state(False)
-            print("[SIM] DS2 -> CLOSED")
-
-        # --- Person counting ---
-        elif cmd == 'e':
-            if "DUS2" in self.components:
-                self.components["DUS2"].set_distance(15.0)
-            self.components["DPIR2"].set_motion(True)
-            print("[SIM] Person entering – DUS2=15 cm, DPIR2 ON")
-            time.sleep(1)
-            self.components["DPIR2"].set_motion(False)
-            if "DUS2" in self.components:
-                self.components["DUS2"].set_distance(200.0)
-
-        elif cmd == 'o':
-            if self.update_person_count:
-                self.update_person_count(-1)
-                self.alarm_sync.publish_person_delta(-1)
-                print(f"[SIM] Person exited -> persons: {self.get_person_count()}")
-            else:
-                print("[SIM] update_person_count not wired (run from main.py)")
-
-        elif cmd == '9':
-            # Motion only (no DUS2 close) – for testing Rule 5
-            self.components["DPIR2"].set_motion(True)
-            print("[SIM] DPIR2 Motion ON (room motion, no person at door)")
-            time.sleep(1)
-            self.components["DPIR2"].set_motion(False)
-
-        # --- Gyroscope ---
-        elif cmd == 'g':
-            if "GSG" in self.components:
-                self.components["GSG"].inject_significant_move()
-            else:
-                print("[SIM] GSG not present")
+        fn = self._cmd_table.get(cmd)
+        if fn is None:
+            return None
+        fn()
+        return True
 
-        # --- Button ---
-        elif cmd == 'p':
-            if "BTN" in self.components:
-                self.components["BTN"].inject_press()
-            else:
-                print("[SIM] BTN not present")
+    # --- Simulation commands (referenced from the table) ---
+
+    def _cmd_door_open(self):
+        self._ds2.set_state(True)
+        print("[SIM] DS2 -> OPEN")
+
+    def _cmd_door_close(self):
+        self._ds2.set_state(False)
+        print("[SIM] DS2 -> CLOSED")
+
+    def _cmd_person_enter(self):
+        if self._dus2 is not None:
+            self._dus2.set_distance(15.0)
+        self._dpir2.set_motion(True)
+        print("[SIM] Person entering – DUS2=15 cm, DPIR2 ON")
+        # Clear the injected state off-thread: a blocking sleep here
+        # would freeze the CLI loop for the full second
+        get_scheduler().once(1.0, self._sim_person_enter_done)
+
+    def _sim_person_enter_done(self):
+        self._dpir2.set_motion(False)
+        if self._dus2 is not None:
+            self._dus2.set_distance(200.0)
+
+    def _cmd_person_exit(self):
+        if self.update_person_count:
+            self.update_person_count(-1)
+            self.alarm_sync.publish_person_delta(-1)
+            print(f"[SIM] Person exited -> persons: {self.get_person_count()}")
+        else:
+            print("[SIM] update_person_count not wired (run from main.py)")
 
-        # --- DUS2 custom distance ---
-        elif cmd == 'd':
-            try:
-                dist = float(input("DUS2 distance (cm): ").strip())
-                if "DUS2" in self.components:
-                    self.components["DUS2"].set_distance(dist)
-                    print(f"[SIM] DUS2 -> {dist:.1f} cm")
-            except ValueError:
-                print("[SIM] Invalid distance")
+    def _cmd_motion_only(self):
+        # Motion only (no DUS2 close) – for testing Rule 5
+        self._dpir2.set_motion(True)
+        print("[SIM] DPIR2 Motion ON (room motion, no person at door)")
+        get_scheduler().once(1.0, lambda: self._dpir2.set_motion(False))
 
+    def _cmd_gyro_move(self):
+        if self._gsg is not None:
+            self._gsg.inject_significant_move()
         else:
-            return None
+            print("[SIM] GSG not present")
 
-        return True
+    def _cmd_button_press(self):
+        if self._btn is not None:
+            self._btn.inject_press()
+        else:
+            print("[SIM] BTN not present")
+
+    def _cmd_set_distance(self):
+        try:
+            dist = float(input("DUS2 distance (cm): ").strip())
+            if self._dus2 is not None:
+                self._dus2.set_distance(dist)
+                print(f"[SIM] DUS2 -> {dist:.1f} cm")
+        except ValueError:
+            print("[SIM] Invalid distance")
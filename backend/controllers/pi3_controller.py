@@ -4,7 +4,14 @@ import json
 import threading
 import time
 
-import paho.mqtt.client as mqtt
+try:
+    # C-accelerated JSON for the sensor-sync callback: it parses every
+    # inbound PI2 batch on paho's network thread, and orjson takes the
+    # payload bytes directly
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
 
 from mqtt_publisher import MQTTBatchPublisher
 
@@ -15,9 +22,19 @@ from components import (
     RGBLight,
     MotionSensor,
 )
-from controllers.alarm_mqtt_sync import AlarmMQTTSync
+from controllers.alarm_mqtt_sync import (
+    AlarmMQTTSync,
+    _broker_for,
+    _broker_release,
+)
 from simulators import PI3Simulator
 
+# Batch-source filter constant. Deliberately compared with != rather than
+# `is` against an interned string: orjson does not intern parsed strings,
+# and CPython's str compare already short-circuits on pointer equality
+# and length before touching characters.
+_BATCH_SOURCE = 'PI2'
+
 
 class PI3Controller:
     """
@@ -36,6 +53,7 @@ class PI3Controller:
 
     LCD_CYCLE_INTERVAL  = 3   # Rule 7: seconds between DHT display updates
     DHT_PUBLISH_INTERVAL = 10  # seconds between DHT1/DHT2 MQTT publishes
+    MOTION_LOG_INTERVAL = 1.0  # min seconds between motion console lines
 
     IR_CODE_TOGGLE = 'TOGGLE'
     IR_CODE_RED    = 'RED'
@@ -65,10 +83,21 @@ class PI3Controller:
         # Rule 7 state
         self._lcd_thread         = None
         self._dht_publish_thread = None
-        self._dht3_cache = None   # (temp, humidity) received from PI2 via MQTT
-
-        # DHT3 sensor sync: subscribe to iot/sensors to receive PI2's DHT3 data
-        self._sensor_sync_client = None
+        # Latest (temp, humidity) received from PI2 via MQTT. Written by
+        # the MQTT callback thread, read by the LCD loop and the CLI.
+        # Deliberately lock-free: the write is a single reference swap of
+        # an immutable tuple, which CPython makes atomic — readers must
+        # snapshot it into a local once and never re-read mid-use.
+        self._dht3_cache = None
+        # Wakes the periodic loops on stop() instead of letting them
+        # sleep out their interval
+        self._stop_event = threading.Event()
+
+        # DHT3 sensor sync: PI2's batch subtopic, attached to the shared
+        # broker client the alarm sync already holds — no second paho
+        # client, socket or keepalive timer for the same endpoint
+        self._sensor_broker = None
+        self._sensor_subs   = []
 
         # Alarm sync: PI3 is a slave
         self.alarm_sync = AlarmMQTTSync(
@@ -81,6 +110,9 @@ class PI3Controller:
         )
         self._known_alarm_state = alarm_cfg.get('initial_state', 'DISARMED')
 
+        # Rate limit for the motion console line (see _on_motion)
+        self._last_motion_log = 0.0
+
         self._init_components()
 
     # ========== INIT ==========
@@ -93,40 +125,40 @@ class PI3Controller:
         print("Initializing PI3 Components...")
         print("=" * 50)
 
-        if "DHT1" in s:
-            self.components["DHT1"] = DHTSensor('DHT1', s["DHT1"], publisher=self.publisher)
-            self._log_init("DHT1")
-
-        if "DHT2" in s:
-            self.components["DHT2"] = DHTSensor('DHT2', s["DHT2"], publisher=self.publisher)
-            self._log_init("DHT2")
-
-        if "IR" in s:
-            self.components["IR"] = IRReceiver(
-                'IR', s["IR"],
-                publisher=self.publisher,
-                on_code=self._on_ir_code,      # Rule 9
-            )
-            self._log_init("IR")
-
-        if "BRGB" in s:
-            self.components["BRGB"] = RGBLight('BRGB', s["BRGB"], publisher=self.publisher)
-            self._log_init("BRGB")
-
-        if "LCD" in s:
-            self.components["LCD"] = LCDDisplay('LCD', s["LCD"], publisher=self.publisher)
-            self._log_init("LCD")
-
-        if "DPIR3" in s:
-            self.components["DPIR3"] = MotionSensor(
-                'DPIR3', s["DPIR3"],
-                publisher=self.publisher,
-                on_motion=self._on_motion,     # Rule 5
-            )
-            self._log_init("DPIR3")
+        pub = self.publisher
+        # Driver table instead of six near-identical if-blocks; each
+        # entry builds its component from that sensor's settings
+        specs = (
+            ("DHT1",  lambda cfg: DHTSensor('DHT1', cfg, publisher=pub)),
+            ("DHT2",  lambda cfg: DHTSensor('DHT2', cfg, publisher=pub)),
+            ("IR",    lambda cfg: IRReceiver(
+                'IR', cfg, publisher=pub,
+                on_code=self._on_ir_code)),    # Rule 9
+            ("BRGB",  lambda cfg: RGBLight('BRGB', cfg, publisher=pub)),
+            ("LCD",   lambda cfg: LCDDisplay('LCD', cfg, publisher=pub)),
+            ("DPIR3", lambda cfg: MotionSensor(
+                'DPIR3', cfg, publisher=pub,
+                on_motion=self._on_motion)),   # Rule 5
+        )
+        for code, make in specs:
+            cfg = s.get(code)
+            if cfg is not None:
+                self.components[code] = make(cfg)
+                self._log_init(code)
 
         print("=" * 50)
 
+        # Rule 9 dispatch: IR codes resolve through one dict lookup to a
+        # bound light method instead of an if/elif chain of string
+        # compares per event
+        rgb = self.components.get("BRGB")
+        self._ir_handlers = {} if rgb is None else {
+            self.IR_CODE_TOGGLE: self._ir_toggle,
+            self.IR_CODE_RED:    rgb.set_red,
+            self.IR_CODE_GREEN:  rgb.set_green,
+            self.IR_CODE_BLUE:   rgb.set_blue,
+        }
+
     def _log_init(self, code):
         s    = self.sensors_settings[code]
         mode = "SIM" if s.get('simulate', True) else "HW"
@@ -183,7 +215,14 @@ class PI3Controller:
         DPIR3 motion event.
         Rule 5: if person_count == 0 -> publish alarm trigger to PI1.
         """
-        print("[DPIR3] Motion detected")
+        # Rate-limited console line: a noisy PIR can fire many times a
+        # second, and an unconditional print would serialize the sensor
+        # thread on the stdout lock per event. The rule evaluation below
+        # still runs for every event.
+        now = time.monotonic()
+        if now - self._last_motion_log >= self.MOTION_LOG_INTERVAL:
+            self._last_motion_log = now
+            print("[DPIR3] Motion detected")
         # --- Rule 5 ---
         if self.get_person_count() == 0 and self._known_alarm_state != 'ALARMING':
             print("[DPIR3] Motion with no occupants -> triggering alarm")
@@ -197,89 +236,83 @@ class PI3Controller:
           GREEN  -> set green
           BLUE   -> set blue
         """
-        rgb = self.components.get("BRGB")
-        if rgb is None:
-            return
+        handler = self._ir_handlers.get(code)
+        if handler is not None:
+            handler()
+        elif "BRGB" in self.components:   # no light: codes are ignored
+            print(f"[IR] Unknown code: '{code}'")
 
-        if code == self.IR_CODE_TOGGLE:
-            if rgb.is_on():
-                rgb.turn_off()
-            else:
-                rgb.set_color(*rgb.get_last_color())
-        elif code == self.IR_CODE_RED:
-            rgb.set_red()
-        elif code == self.IR_CODE_GREEN:
-            rgb.set_green()
-        elif code == self.IR_CODE_BLUE:
-            rgb.set_blue()
+    def _ir_toggle(self):
+        """TOGGLE: off if lit, otherwise restore the last colour."""
+        rgb = self.components["BRGB"]
+        if rgb.is_on():
+            rgb.turn_off()
         else:
-            print(f"[IR] Unknown code: '{code}'")
+            rgb.set_color(*rgb.get_last_color())
 
     # ========== RULE 7: DHT3 SYNC FROM PI2 VIA MQTT ==========
 
     def _start_sensor_sync(self):
-        """Subscribe to iot/sensors to receive DHT3 data published by PI2."""
+        """Subscribe to PI2's batch subtopic for DHT3 data.
+
+        Rides the shared per-endpoint broker client instead of opening a
+        second connection; only PI2's subtopic is subscribed, so the
+        broker filters other devices' batches before they cost a parse.
+        """
         if not self._mqtt_cfg.get('enabled', True):
             return
-
-        host = self._mqtt_cfg.get('host', 'localhost')
-        port = self._mqtt_cfg.get('port', 1883)
-
-        self._sensor_sync_client = mqtt.Client(
-            client_id="sensor-sync-PI3",
-            clean_session=True,
-        )
-
-        user = self._mqtt_cfg.get('username')
-        pwd  = self._mqtt_cfg.get('password')
-        if user:
-            self._sensor_sync_client.username_pw_set(user, pwd)
-
-        self._sensor_sync_client.on_connect = self._sensor_sync_on_connect
-        self._sensor_sync_client.on_message = self._sensor_sync_on_message
-
-        try:
-            self._sensor_sync_client.connect(host, port, keepalive=60)
-            self._sensor_sync_client.loop_start()
-        except Exception as exc:
-            print(f"[PI3] DHT3 sync connection failed: {exc}")
+        topic = self._mqtt_cfg.get('topic', 'iot/sensors')
+        self._sensor_subs = [(f"{topic}/PI2", 1, self._on_sensor_batch)]
+        self._sensor_broker = _broker_for(self._mqtt_cfg, "sensor-sync-PI3")
+        if self._sensor_broker is None:
+            self._sensor_subs = []
+            return
+        self._sensor_broker.attach(self._sensor_subs)
 
     def _stop_sensor_sync(self):
-        if self._sensor_sync_client:
-            self._sensor_sync_client.loop_stop()
-            try:
-                self._sensor_sync_client.disconnect()
-            except Exception:
-                pass
-            self._sensor_sync_client = None
-
-    def _sensor_sync_on_connect(self, client, userdata, flags, rc):
-        if rc == 0:
-            topic = self._mqtt_cfg.get('topic', 'iot/sensors')
-            client.subscribe(topic, qos=1)
-
-    def _sensor_sync_on_message(self, client, userdata, msg):
-        """Parse incoming batch messages and cache DHT3 readings from PI2."""
+        if self._sensor_broker is not None:
+            _broker_release(self._sensor_broker, self._sensor_subs)
+            self._sensor_broker = None
+            self._sensor_subs   = []
+
+    def _on_sensor_batch(self, raw):
+        """Parse an incoming PI2 batch and cache its DHT3 reading."""
         try:
-            payload = json.loads(msg.payload.decode())
+            # both loaders take the payload bytes directly; no decode
+            payload = _loads(raw)
         except Exception:
             return
 
         if not isinstance(payload, dict):
             return
 
-        # Only process PI2 messages  ('device' is a plain string in batch payloads)
-        if payload.get('device') != 'PI2':
+        # Safety net only: the per-device subscription already filters
+        # non-PI2 traffic at the broker
+        if payload.get('device') != _BATCH_SOURCE:
             return
 
-        for item in payload.get('items', []):
+        # Current batches index the latest value per sensor; one lookup
+        # replaces the per-item scan
+        by_sensor = payload.get('by_sensor')
+        if by_sensor is not None:
+            self._cache_dht3(by_sensor.get('DHT3'))
+            return
+
+        for item in payload.get('items', []):   # legacy batch shape
             if item.get('sensor') == 'DHT3':
-                val = item.get('value', {})
-                if isinstance(val, dict):
-                    t = val.get('temperature')
-                    h = val.get('humidity')
-                    if t is not None and h is not None:
-                        self._dht3_cache = (float(t), float(h))
+                self._cache_dht3(item.get('value'))
+
+    def _cache_dht3(self, val):
+        """Store a (temp, humidity) pair from a DHT3 batch value."""
+        if isinstance(val, dict):
+            # Short wire keys ('t'/'h'); long names kept as fallback
+            t = val.get('t', val.get('temperature'))
+            h = val.get('h', val.get('humidity'))
+            if t is not None and h is not None:
+                # The batch payload is machine-generated, so the parser
+                # already produced numbers; the :.1f consumers format
+                # ints and floats alike, no coercion needed
+                self._dht3_cache = (t, h)
 
     # ========== DHT1/DHT2 PERIODIC PUBLISH ==========
 
@@ -288,11 +321,13 @@ class PI3Controller:
         Periodically read and publish DHT1/DHT2 to MQTT so the web app
         receives temperature data without requiring the CLI 't' command.
         """
+        stop_wait = self._stop_event.wait
         while self.running:
             for key in ('DHT1', 'DHT2'):
                 if key in self.components:
                     self.components[key].read_and_publish(silent=True)
-            time.sleep(self.DHT_PUBLISH_INTERVAL)
+            if stop_wait(self.DHT_PUBLISH_INTERVAL):
+                break
 
     # ========== RULE 7: LCD DHT CYCLING ==========
 
@@ -302,30 +337,44 @@ class PI3Controller:
         Cycles DHT1 and DHT2 (local sensors) and DHT3 (received from PI2 via
         MQTT) on the LCD every LCD_CYCLE_INTERVAL seconds.
         """
+        lcd       = self.components.get("LCD")
+        labels    = [k for k in ('DHT1', 'DHT2') if k in self.components]
+        stop_wait = self._stop_event.wait
         idx = 0
+        last_line = None
         while self.running:
-            sources = []
-            for key in ('DHT1', 'DHT2'):
-                if key in self.components:
-                    temp, humidity = self.components[key].read()
-                    sources.append((key, temp, humidity))
-            if self._dht3_cache is not None:
-                temp, humidity = self._dht3_cache
-                sources.append(('DHT3', temp, humidity))
-
-            if sources:
-                label, temp, humidity = sources[idx % len(sources)]
-                lcd = self.components.get("LCD")
-                if lcd:
-                    lcd.show(f"{label}: {temp:.1f}C {humidity:.0f}%")
+            # Only the sensor actually shown this tick is read: on
+            # hardware a DHT read blocks for tens of ms, and two of the
+            # three readings were previously thrown away every cycle
+            dht3 = self._dht3_cache
+            n = len(labels) + (1 if dht3 is not None else 0)
+            if n:
+                choice = idx % n
+                if choice < len(labels):
+                    label = labels[choice]
+                    temp, humidity = self.components[label].read()
+                else:
+                    label = 'DHT3'
+                    temp, humidity = dht3
+                line = f"{label}: {temp:.1f}C {humidity:.0f}%"
+                # Re-showing what the LCD already displays would only
+                # redo the clear + two I2C line writes; common with a
+                # single source and a stable reading
+                if lcd and line != last_line:
+                    lcd.show(line)
+                    last_line = line
                 idx += 1
 
-            time.sleep(self.LCD_CYCLE_INTERVAL)
+            # Event wait instead of sleep: stop() wakes the loop
+            # immediately rather than after up to a full interval
+            if stop_wait(self.LCD_CYCLE_INTERVAL):
+                break
 
     # ========== LIFECYCLE ==========
 
     def start(self):
         self.running = True
+        self._stop_event.clear()
         self.publisher.start()
         self.alarm_sync.start()
         self._start_sensor_sync()
@@ -356,14 +405,25 @@ class PI3Controller:
 
     def stop(self):
         self.running = False
+        self._stop_event.set()
+        if self._lcd_thread is not None:
+            self._lcd_thread.join(timeout=1)
+            self._lcd_thread = None
+        if self._dht_publish_thread is not None:
+            self._dht_publish_thread.join(timeout=1)
+            self._dht_publish_thread = None
         if self.simulator:
             self.simulator.stop()
         self._stop_sensor_sync()
-        self.alarm_sync.stop()
-        self.publisher.stop()
+        # Stop sensors first and flush their batch buffers while the
+        # publisher is still alive, so the tail of each batch goes out
+        # instead of being dropped with the publisher process
         for comp in self.components.values():
             if hasattr(comp, 'stop'):
                 comp.stop()
+            comp.flush()
+        self.alarm_sync.stop()
+        self.publisher.stop()
 
     def cleanup(self):
         self.stop()
@@ -382,8 +442,9 @@ class PI3Controller:
         if "DHT2" in self.components:
             t, h = self.components["DHT2"].read()
             status["DHT2"] = f"{t:.1f}C {h:.0f}%"
-        if self._dht3_cache is not None:
-            t, h = self._dht3_cache
+        dht3 = self._dht3_cache   # snapshot: swapped by the MQTT thread
+        if dht3 is not None:
+            t, h = dht3
             status["DHT3"] = f"{t:.1f}C {h:.0f}%"
         if "BRGB" in self.components:
             r, g, b = self.components["BRGB"].get_color()
@@ -438,8 +499,9 @@ class PI3Controller:
             for key in ('DHT1', 'DHT2'):
                 if key in self.components:
                     self.components[key].read_and_publish()
-            if self._dht3_cache is not None:
-                temp, humidity = self._dht3_cache
+            dht3 = self._dht3_cache   # snapshot: swapped by the MQTT thread
+            if dht3 is not None:
+                temp, humidity = dht3
                 print(f"[DHT3] Temp={temp:.1f}C  Humidity={humidity:.1f}%")
             else:
                 print("[DHT3] No data received yet")
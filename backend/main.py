@@ -23,8 +23,11 @@ For real hardware: run main.py on each Pi separately; they share the MQTT
 broker on the network.
 """
 
+import functools
 import subprocess
 import socket
+import sys
+import threading
 
 from settings import load_settings
 from controllers import PI1Controller, PI2Controller, PI3Controller
@@ -87,8 +90,13 @@ PI3_HELP = """
 
 # ========== WEB CAMERA (MJPG_STREAMER) ==========
 
+@functools.lru_cache(maxsize=1)
 def _get_local_ip():
-    """Auto-detect the local IP address of this machine."""
+    """Auto-detect the local IP address of this machine.
+
+    Cached: the answer costs a UDP socket plus a kernel route lookup
+    and doesn't change within a process lifetime.
+    """
     try:
         s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         s.connect(("8.8.8.8", 80))
@@ -151,24 +159,39 @@ def stop_camera(proc):
 # Rule 5: alarm triggers when count == 0 and motion is detected.
 
 person_count = [0]
+_count_lock  = threading.Lock()
+
+
+def apply_count(delta):
+    """
+    Atomically adjust the occupant count by delta and return the new value.
+    Update and read happen under one lock, so the caller can broadcast the
+    returned count without a concurrent update slipping in between.
+    """
+    with _count_lock:
+        person_count[0] = max(0, person_count[0] + delta)
+        count = person_count[0]
+    print(f"[HOME] Persons in home: {count}")
+    return count
 
 
 def update_count(delta):
     """Adjust shared occupant count by delta (+1 enter, -1 exit), clamped >= 0."""
-    person_count[0] = max(0, person_count[0] + delta)
-    print(f"[HOME] Persons in home: {person_count[0]}")
+    apply_count(delta)
 
 
 def set_count(value):
     """Set absolute person count (received from MQTT sync)."""
-    person_count[0] = max(0, int(value))
+    with _count_lock:
+        person_count[0] = max(0, int(value))
 
 
 # ========== CONTROLLER REGISTRY ==========
 # key -> (display label, ControllerClass, help_text, settings_key, extra_kwargs_fn)
 
 def _pi1_extra():
-    return {"update_person_count": update_count, "set_person_count": set_count}
+    return {"update_person_count": update_count, "set_person_count": set_count,
+            "apply_person_delta": apply_count}
 
 def _pi2_extra():
     return {"update_person_count": update_count, "set_person_count": set_count}
@@ -220,16 +243,30 @@ def run_loop(controller, help_text):
     print(f"\n[SYSTEM] Running...  (press 'h' for help, 'b' to go back)\n")
     print(help_text)
 
+    # Read stdin directly: input() re-derives the prompt write and pays
+    # strip/lower even on the (common) empty line
+    write    = sys.stdout.write
+    flush    = sys.stdout.flush
+    readline = sys.stdin.readline
+
     while True:
         try:
-            cmd = input("\n> ").strip().lower()
-        except (KeyboardInterrupt, EOFError):
+            write("\n> ")
+            flush()
+            line = readline()
+        except KeyboardInterrupt:
+            print("\n\nExiting...")
+            return False
+        if not line:   # EOF (ctrl-D / piped input exhausted)
             print("\n\nExiting...")
             return False
 
+        cmd = line.strip()
         if not cmd:
             continue
-        elif cmd == 'q':
+        cmd = cmd.lower()
+
+        if cmd == 'q':
             print("\nExiting...")
             return False
         elif cmd == 'b':
@@ -4,6 +4,14 @@ import time
 import queue
 import multiprocessing
 
+try:
+    # orjson encodes several times faster than stdlib json and emits bytes,
+    # which paho accepts directly as a publish payload
+    import orjson
+    _dumps = orjson.dumps
+except ImportError:
+    _dumps = json.dumps
+
 
 def _publisher_process(config, device_info, q):
     try:
@@ -16,7 +24,14 @@ def _publisher_process(config, device_info, q):
     port = int(config.get("port", 1883))
     username = config.get("username")
     password = config.get("password")
+    # Per-device subtopic: subscribers that only care about one device
+    # (PI3's DHT3 sync tracks PI2) can let the broker filter for them
+    # instead of parsing and discarding other devices' batches. Wildcard
+    # consumers (the collector) subscribe to <topic>/#.
     topic = config.get("topic", "iot/sensors")
+    device_id = device_info.get("id")
+    if device_id:
+        topic = f"{topic}/{device_id}"
     qos = int(config.get("qos", 1))
     batch_interval = float(config.get("batch_interval", 2.0))
     max_batch = int(config.get("max_batch", 50))
@@ -27,6 +42,16 @@ def _publisher_process(config, device_info, q):
     if username:
         client.username_pw_set(username, password)
 
+    # Publishes are fire-and-forget (paho's loop thread handles the QoS-1
+    # handshake); we only track outstanding mids so shutdown can wait for
+    # the broker to ack everything instead of dropping in-flight batches.
+    inflight = set()
+
+    def on_publish(cli, userdata, mid):
+        inflight.discard(mid)
+
+    client.on_publish = on_publish
+
     try:
         client.connect(host, port, 60)
     except Exception as exc:
@@ -44,37 +69,55 @@ def _publisher_process(config, device_info, q):
         nonlocal batch, last_flush
         if not batch:
             return
-        payload = json.dumps({
+        payload = _dumps({
             "device": device_info.get("id"),
             "batch": True,
+            # Latest value per sensor, so subscribers that track one
+            # sensor (PI3's DHT3 cache) do a dict lookup instead of
+            # scanning the batch; items stays the full event list
+            "by_sensor": {item.get("sensor"): item.get("value")
+                          for item in batch},
             "items": batch,
         })
         result = client.publish(topic, payload, qos=qos)
         # print(f"[MQTT] Published {len(batch)} items (rc={result.rc})", flush=True)
+        if qos > 0 and result.rc == mqtt.MQTT_ERR_SUCCESS:
+            inflight.add(result.mid)
         batch = []
         last_flush = time.monotonic()
 
     try:
         while True:
+            # Wait exactly until the next flush deadline: everything that
+            # arrives in the same window rides out in one PUBLISH with a
+            # JSON array body, and an idle window flushes on time rather
+            # than up to a fixed poll interval late.
+            timeout = batch_interval - (time.monotonic() - last_flush)
+            if timeout <= 0:
+                flush()
+                timeout = batch_interval
             try:
-                item = q.get(timeout=0.2)
+                item = q.get(timeout=timeout)
             except queue.Empty:
-                item = None
-
-            if item is None:
-                if time.monotonic() - last_flush >= batch_interval:
-                    flush()
+                flush()
                 continue
 
             if item == "__STOP__":
                 flush()
+                # Bounded drain: give the broker a moment to ack whatever
+                # is still in flight before disconnecting
+                deadline = time.monotonic() + 2.0
+                while inflight and time.monotonic() < deadline:
+                    time.sleep(0.05)
                 break
 
-            batch.append(item)
+            # Components hand over pre-batched lists; flatten them here
+            if isinstance(item, list):
+                batch.extend(item)
+            else:
+                batch.append(item)
             if len(batch) >= max_batch:
                 flush()
-            elif time.monotonic() - last_flush >= batch_interval:
-                flush()
     finally:
         try:
             client.loop_stop()
@@ -84,6 +127,15 @@ def _publisher_process(config, device_info, q):
 
 
 class MQTTBatchPublisher:
+    """Batches sensor payloads and ships them from a child process.
+
+    Construction is connection-free: __init__ only stores config and
+    creates the queue, so controllers can build the publisher and wire
+    components to it without paying (or depending on) a broker
+    handshake. The TCP connect happens in start(); anything enqueued
+    before that simply waits in the queue.
+    """
+
     def __init__(self, config, device_info):
         self.config = config or {}
         self.device_info = device_info or {}
@@ -111,6 +163,15 @@ class MQTTBatchPublisher:
         except Exception:
             pass
 
+    def enqueue_batch(self, items):
+        """Enqueue a list of payloads as one queue operation."""
+        if not self.enabled or not items:
+            return
+        try:
+            self._queue.put_nowait(list(items))
+        except Exception:
+            pass
+
     def stop(self):
         if self._process and self._process.is_alive():
             try:
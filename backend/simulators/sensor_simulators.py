@@ -2,6 +2,12 @@ import random
 import threading
 import time
 
+try:
+    import numpy
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 from components.dht_sensor import DHTSensor
 from components.motion_sensor import MotionSensor
 from components.ultrasonic_sensor import UltrasonicSensor
@@ -31,6 +37,18 @@ class SensorSimulator:
         """
         self.running = True
 
+        # All DHT sensors share one drift thread (one batched update per tick)
+        dht_comps = [comp for comp in self.components.values()
+                     if isinstance(comp, DHTSensor) and comp.simulate]
+        if dht_comps:
+            t = threading.Thread(
+                target=self._simulate_dht_all,
+                args=(dht_comps,),
+                daemon=True
+            )
+            t.start()
+            self.threads.append(t)
+
         for code, comp in self.components.items():
             t = None
 
@@ -46,12 +64,6 @@ class SensorSimulator:
                     args=(code,),
                     daemon=True
                 )
-            elif isinstance(comp, DHTSensor) and comp.simulate:
-                t = threading.Thread(
-                    target=self._simulate_dht,
-                    args=(code,),
-                    daemon=True
-                )
             elif isinstance(comp, IRReceiver) and comp.simulate:
                 t = threading.Thread(
                     target=self._simulate_ir,
@@ -85,22 +97,35 @@ class SensorSimulator:
                 comp.set_motion(False)
             time.sleep(8)
 
-    def _simulate_dht(self, code):
+    def _simulate_dht_all(self, comps):
         """
-        Simulate slow DHT temperature and humidity drift.
-        Values change by small increments to mimic real sensor behavior.
+        Simulate slow temperature and humidity drift for every DHT sensor
+        from a single thread, one batched update per tick.
+        Uses NumPy to step all sensors at once when it is installed; falls
+        back to a plain Python loop otherwise.
         """
-        comp = self.components[code]
-        temp = random.uniform(18.0, 28.0)
-        humidity = random.uniform(40.0, 70.0)
-        while self.running:
-            temp += random.uniform(-0.5, 0.5)
-            humidity += random.uniform(-1.0, 1.0)
-            # Clamp to realistic bounds
-            temp = max(18.0, min(28.0, temp))
-            humidity = max(40.0, min(70.0, humidity))
-            comp.set_values(temp, humidity)
-            time.sleep(10)
+        n = len(comps)
+        if NUMPY_AVAILABLE:
+            temp = numpy.random.uniform(18.0, 28.0, n)
+            humidity = numpy.random.uniform(40.0, 70.0, n)
+            while self.running:
+                temp = numpy.clip(
+                    temp + numpy.random.uniform(-0.5, 0.5, n), 18.0, 28.0)
+                humidity = numpy.clip(
+                    humidity + numpy.random.uniform(-1.0, 1.0, n), 40.0, 70.0)
+                for comp, t, h in zip(comps, temp, humidity):
+                    comp.set_values(float(t), float(h))
+                time.sleep(10)
+        else:
+            values = [[random.uniform(18.0, 28.0), random.uniform(40.0, 70.0)]
+                      for _ in range(n)]
+            while self.running:
+                for comp, v in zip(comps, values):
+                    # Clamp to realistic bounds
+                    v[0] = max(18.0, min(28.0, v[0] + random.uniform(-0.5, 0.5)))
+                    v[1] = max(40.0, min(70.0, v[1] + random.uniform(-1.0, 1.0)))
+                    comp.set_values(v[0], v[1])
+                time.sleep(10)
 
     def _simulate_ir(self, code):
         """
@@ -92,10 +92,11 @@ class Dashboard {
     _updateDHT(sensor, value) {
         const p = sensor.toLowerCase();
         if (typeof value === "object" && value !== null) {
-            if (value.temperature != null)
-                this._setText(`${p}-temp`, Number(value.temperature).toFixed(1));
-            if (value.humidity != null)
-                this._setText(`${p}-hum`, Number(value.humidity).toFixed(1));
+            // Short wire keys ('t'/'h'); long names accepted for old payloads
+            const temp = value.t != null ? value.t : value.temperature;
+            const hum  = value.h != null ? value.h : value.humidity;
+            if (temp != null) this._setText(`${p}-temp`, Number(temp).toFixed(1));
+            if (hum  != null) this._setText(`${p}-hum`,  Number(hum).toFixed(1));
         }
     }
 
@@ -152,19 +153,19 @@ class Dashboard {
     _updateGyroscope(item) {
         const el = document.getElementById("gsg-value");
         if (!el) return;
-        // Accel fields are at the top level of the batch item (ax, ay, az)
-        if (item.ax != null) {
+        // Accel fields are at the top level of the batch item (x, y, z)
+        if (item.x != null) {
             el.textContent =
-                `x:${Number(item.ax).toFixed(2)}  y:${Number(item.ay).toFixed(2)}  z:${Number(item.az).toFixed(2)}`;
+                `x:${Number(item.x).toFixed(2)}  y:${Number(item.y).toFixed(2)}  z:${Number(item.z).toFixed(2)}`;
         }
     }
 
     _updateTimer(item) {
         const el = document.getElementById("timer-display");
         if (!el) return;
-        const action = item.action;
+        const action = item.a;
         if (action === "show_time") {
-            el.textContent = item.display || "00:00";
+            el.textContent = item.d || "00:00";
             el.classList.remove("timer-blink");
         } else if (action === "blink_start") {
             el.textContent = "00:00";
@@ -86,7 +86,9 @@ class SmartHomeMQTT {
             return;
         }
         const payload = JSON.stringify({ target, command, params: params || {} });
-        this.client.publish(this.config.topics.webCommand, payload);
+        // Per-device subtopic: the broker routes the command only to the
+        // targeted PI, so the others never see (or parse) it
+        this.client.publish(`${this.config.topics.webCommand}/${target}`, payload);
         console.log(`[MQTT] Command -> ${target}: ${command}`, params);
     }
 